@@ -15,16 +15,45 @@ Source: https://github.com/ivantohelpyou/vikunja-mcp
 PyPI: https://pypi.org/project/vikunja-mcp/
 """
 
+import asyncio
+import atexit
+import bisect
+import copy
+import functools
+import heapq
 import json
 import logging
+import operator
 import os
+import re
 import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import requests
 import yaml
+
+try:
+    # C+SIMD JSON parser - several times faster than stdlib json on the
+    # large list responses (/projects/{id}/tasks). Optional: pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # LibYAML C bindings: 5-10x faster than the pure-Python parser/emitter
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from fastmcp import FastMCP
 from pydantic import Field
 
@@ -34,6 +63,9 @@ from pydantic import Field
 
 CONFIG_DIR = Path.home() / ".vikunja-mcp"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
+# JSON shadow of config.yaml: json.loads is much faster than even LibYAML,
+# so cold loads prefer it whenever it's at least as new as the YAML.
+CONFIG_JSON_FILE = CONFIG_DIR / "config.json"
 
 logger = logging.getLogger("vikunja-mcp")
 logger.setLevel(logging.DEBUG if os.environ.get("VIKUNJA_DEBUG") else logging.INFO)
@@ -50,6 +82,18 @@ if not logger.handlers:
 # MCP SERVER
 # ============================================================================
 
+# Shared Field descriptors for parameters that recur across dozens of tools.
+# Pydantic reuses the FieldInfo instead of materializing a fresh one per
+# signature, which trims import-time schema construction.
+ProjectIDField = Field(description="Project ID")
+TaskIDField = Field(description="Task ID")
+KanbanViewIDField = Field(description="Kanban view ID")
+InstanceFilterField = Field(default="", description="Filter to specific instance. Empty = all.")
+
+# Tools are registered eagerly: every @mcp.tool() below builds its schema at
+# import. Deferring that until tools/list was considered and rejected - it
+# requires patching FastMCP's private tool manager, and clients fetch the
+# full tool list right after the handshake anyway, so nothing is saved.
 mcp = FastMCP(
     "Vikunja MCP",
     instructions="""Manage tasks, projects, labels, and kanban boards in Vikunja.
@@ -72,57 +116,139 @@ X-Q (Exchange Queue) for agent handoffs:
 # CONFIG FILE MANAGEMENT
 # ============================================================================
 
+# Parsed config cached against the file's (st_mtime_ns, st_size) so warm
+# calls skip both the read and the YAML parse. Nearly every tool loads the
+# config, so this turns a per-call parse into a single os.stat.
+_CONFIG_CACHE: Optional[tuple[tuple[int, int], dict]] = None
+_CONFIG_LOCK = threading.Lock()
+
+# Env-only deployments (VIKUNJA_INSTANCES / VIKUNJA_URL) never have a config
+# file; remember the ENOENT so each tool call skips the stat. _save_config is
+# the only thing that creates the file in-process and clears the flag.
+_CONFIG_FILE_MISSING = False
+
+
 def _load_config() -> dict:
-    """Load config from YAML file."""
-    if not CONFIG_FILE.exists():
+    """Load config from YAML file (cached until the file changes on disk)."""
+    global _CONFIG_CACHE, _CONFIG_FILE_MISSING
+    if _CONFIG_FILE_MISSING:
+        return {"instances": {}, "current_instance": None, "xq": {}, "mcp_context": {}}
+    try:
+        stat = os.stat(CONFIG_FILE)
+    except OSError:
+        _CONFIG_FILE_MISSING = True
+        return {"instances": {}, "current_instance": None, "xq": {}, "mcp_context": {}}
+
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+            return copy.deepcopy(_CONFIG_CACHE[1])
+
+    config = None
+
+    # Prefer the JSON shadow written by _save_config when it's at least as
+    # new as the YAML (hand-edits to the YAML make it newer and win).
+    try:
+        if os.stat(CONFIG_JSON_FILE).st_mtime_ns >= stat.st_mtime_ns:
+            with open(CONFIG_JSON_FILE, "r") as f:
+                config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        config = None
+
+    if config is None:
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                config = yaml.load(f, Loader=SafeLoader) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Malformed config file: {e}")
+
+    for key in ["instances", "xq", "mcp_context"]:
+        if key not in config:
+            config[key] = {}
+
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE = (cache_key, copy.deepcopy(config))
+    return config
+
+
+def _load_config_readonly() -> dict:
+    """Load config for read-only use - returns the cached dict without copying.
+
+    Callers must not mutate the result (or anything nested in it); use
+    _load_config() when the config will be modified and saved.
+    """
+    global _CONFIG_CACHE
+    if _CONFIG_FILE_MISSING:
         return {"instances": {}, "current_instance": None, "xq": {}, "mcp_context": {}}
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = yaml.safe_load(f) or {}
-            for key in ["instances", "xq", "mcp_context"]:
-                if key not in config:
-                    config[key] = {}
-            return config
-    except yaml.YAMLError as e:
-        raise ValueError(f"Malformed config file: {e}")
+        stat = os.stat(CONFIG_FILE)
+    except OSError:
+        return {"instances": {}, "current_instance": None, "xq": {}, "mcp_context": {}}
+
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+            return MappingProxyType(_CONFIG_CACHE[1])
+
+    # Cold path: populate the cache, then hand out the read-only view
+    _load_config()
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is not None:
+            return MappingProxyType(_CONFIG_CACHE[1])
+    return _load_config()
 
 
 def _save_config(config: dict) -> None:
     """Save config to YAML file (atomic write)."""
+    global _CONFIG_CACHE, _CONFIG_FILE_MISSING
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     fd, temp_path = tempfile.mkstemp(dir=CONFIG_DIR, suffix=".yaml")
     try:
         with os.fdopen(fd, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
         os.replace(temp_path, CONFIG_FILE)
+        with _CONFIG_LOCK:
+            _CONFIG_CACHE = None
+        _CONFIG_FILE_MISSING = False
     except Exception:
         os.unlink(temp_path)
         raise
 
+    # Refresh the JSON shadow (best-effort: the YAML is the source of truth)
+    fd, temp_path = tempfile.mkstemp(dir=CONFIG_DIR, suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f)
+        os.replace(temp_path, CONFIG_JSON_FILE)
+    except Exception:
+        os.unlink(temp_path)
+
 
 # ============================================================================
 # INSTANCE MANAGEMENT
 # ============================================================================
 
-def _get_instances() -> dict:
-    """Get all configured Vikunja instances.
+# VIKUNJA_INSTANCES parse memoized against the raw env string - the env
+# doesn't change in any realistic deployment, so this runs once per process.
+_ENV_INSTANCES_CACHE: Optional[tuple[str, dict]] = None
 
-    Priority:
-    1. Config file (~/.vikunja-mcp/config.yaml)
-    2. VIKUNJA_INSTANCES env var (JSON object: {"name": {"url": "...", "token": "..."}})
-    3. VIKUNJA_URL/VIKUNJA_TOKEN env vars as 'default'
-    """
-    config = _load_config()
-    instances = dict(config.get("instances", {}))
 
-    # Parse VIKUNJA_INSTANCES env var
-    # Supports both formats:
-    #   Array: [{"name": "foo", "url": "...", "token": "..."}]
-    #   Object: {"foo": {"url": "...", "token": "..."}}
+def _parse_env_instances() -> dict:
+    """Parse the VIKUNJA_INSTANCES env var (cached on the raw string).
+
+    Supports both formats:
+      Array: [{"name": "foo", "url": "...", "token": "..."}]
+      Object: {"foo": {"url": "...", "token": "..."}}
+    """
+    global _ENV_INSTANCES_CACHE
     instances_json = os.environ.get("VIKUNJA_INSTANCES", "")
+    if _ENV_INSTANCES_CACHE is not None and _ENV_INSTANCES_CACHE[0] == instances_json:
+        return _ENV_INSTANCES_CACHE[1]
+
+    instances = {}
     if instances_json:
         try:
-            env_instances = json.loads(instances_json)
+            env_instances = _loads(instances_json)
             if isinstance(env_instances, list):
                 # Array format: [{"name": "...", "url": "...", "token": "..."}]
                 for inst in env_instances:
@@ -135,14 +261,31 @@ def _get_instances() -> dict:
             elif isinstance(env_instances, dict):
                 # Object format: {"name": {"url": "...", "token": "..."}}
                 for name, inst in env_instances.items():
-                    if name not in instances:  # Config file takes precedence
-                        instances[name] = {
-                            "url": inst.get("url", "").rstrip("/"),
-                            "token": inst.get("token", "")
-                        }
+                    instances[name] = {
+                        "url": inst.get("url", "").rstrip("/"),
+                        "token": inst.get("token", "")
+                    }
         except (json.JSONDecodeError, TypeError, AttributeError):
             pass
 
+    _ENV_INSTANCES_CACHE = (instances_json, instances)
+    return instances
+
+
+def _get_instances() -> dict:
+    """Get all configured Vikunja instances.
+
+    Priority:
+    1. Config file (~/.vikunja-mcp/config.yaml)
+    2. VIKUNJA_INSTANCES env var (JSON object: {"name": {"url": "...", "token": "..."}})
+    3. VIKUNJA_URL/VIKUNJA_TOKEN env vars as 'default'
+    """
+    config = _load_config_readonly()
+
+    # One C-level dict union instead of a copy plus per-key membership
+    # checks; config file entries win over env instances.
+    instances = _parse_env_instances() | (config.get("instances") or {})
+
     # Fallback to VIKUNJA_URL/VIKUNJA_TOKEN as 'default'
     env_url = os.environ.get("VIKUNJA_URL")
     env_token = os.environ.get("VIKUNJA_TOKEN")
@@ -155,9 +298,27 @@ def _get_instances() -> dict:
     return instances
 
 
+# Resolved current-instance name, memoized against the same config/env
+# fingerprint as the instance cache - _request resolves this on every call.
+_CURRENT_INSTANCE_CACHE: Optional[tuple[tuple, Optional[str]]] = None
+
+
 def _get_current_instance() -> Optional[str]:
     """Get name of currently active instance."""
-    config = _load_config()
+    global _CURRENT_INSTANCE_CACHE
+    fingerprint = _instance_cfg_fingerprint()
+    cached = _CURRENT_INSTANCE_CACHE
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    current = _resolve_current_instance()
+    _CURRENT_INSTANCE_CACHE = (fingerprint, current)
+    return current
+
+
+def _resolve_current_instance() -> Optional[str]:
+    """Resolve the active instance name from config/env (uncached)."""
+    config = _load_config_readonly()
 
     # Check mcp_context first (set by set_active_context)
     mcp_instance = (config.get("mcp_context") or {}).get("instance")
@@ -179,9 +340,13 @@ def _get_current_instance() -> Optional[str]:
     return None
 
 
-def _set_current_instance(name: str) -> None:
-    """Set the currently active instance."""
-    instances = _get_instances()
+def _set_current_instance(name: str, instances: Optional[dict] = None) -> None:
+    """Set the currently active instance.
+
+    Pass a precomputed instances dict to avoid a second _get_instances call.
+    """
+    if instances is None:
+        instances = _get_instances()
     if name not in instances:
         available = ", ".join(instances.keys()) if instances else "none"
         raise ValueError(f"Instance '{name}' not found. Available: {available}")
@@ -194,8 +359,35 @@ def _set_current_instance(name: str) -> None:
     _save_config(config)
 
 
+# Resolved (url, token) per instance name, so the _request hot path skips
+# the config load, env JSON parse, and ${VAR} resolution. Keyed against a
+# fingerprint of the config file stat + relevant env vars so edits to
+# either drop the whole cache.
+_INSTANCE_CFG_CACHE: dict[str, tuple[str, str]] = {}
+_INSTANCE_CFG_KEY: Optional[tuple] = None
+
+# Env var token references: ${VAR_NAME}
+_ENV_REF_RE = re.compile(r"^\$\{([A-Za-z_][A-Za-z0-9_]*)\}$")
+
+
+def _instance_cfg_fingerprint() -> tuple:
+    """Fingerprint of everything instance resolution depends on."""
+    try:
+        stat = os.stat(CONFIG_FILE)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_key = None
+    return (
+        file_key,
+        os.environ.get("VIKUNJA_INSTANCES", ""),
+        os.environ.get("VIKUNJA_URL", ""),
+        os.environ.get("VIKUNJA_TOKEN", ""),
+    )
+
+
 def _get_instance_config(name: Optional[str] = None) -> tuple[str, str]:
     """Get URL and token for an instance."""
+    global _INSTANCE_CFG_KEY
     if name is None:
         name = _get_current_instance()
 
@@ -206,6 +398,16 @@ def _get_instance_config(name: Optional[str] = None) -> tuple[str, str]:
             return url.rstrip("/"), token
         raise ValueError("No instance configured. Set VIKUNJA_URL/VIKUNJA_TOKEN or configure instances.")
 
+    fingerprint = _instance_cfg_fingerprint()
+    with _CONFIG_LOCK:
+        if _INSTANCE_CFG_KEY == fingerprint:
+            cached = _INSTANCE_CFG_CACHE.get(name)
+            if cached is not None:
+                return cached
+        else:
+            _INSTANCE_CFG_CACHE.clear()
+            _INSTANCE_CFG_KEY = fingerprint
+
     instances = _get_instances()
     if name not in instances:
         raise ValueError(f"Instance '{name}' not found")
@@ -214,9 +416,11 @@ def _get_instance_config(name: Optional[str] = None) -> tuple[str, str]:
     url = instance.get("url")
     token = instance.get("token")
 
-    # Support env var references: ${VAR_NAME}
-    if token and token.startswith("${") and token.endswith("}"):
-        env_var = token[2:-1]
+    # Support env var references: ${VAR_NAME}. Resolution happens at most
+    # once per instance - the result lands in _INSTANCE_CFG_CACHE below.
+    env_ref = _ENV_REF_RE.match(token) if token and token.startswith("${") else None
+    if env_ref:
+        env_var = env_ref.group(1)
         token = os.environ.get(env_var)
         if not token:
             raise ValueError(f"Environment variable {env_var} not set for instance '{name}'")
@@ -224,27 +428,118 @@ def _get_instance_config(name: Optional[str] = None) -> tuple[str, str]:
     if not url or not token:
         raise ValueError(f"Instance '{name}' missing url or token")
 
-    return url.rstrip("/"), token
+    resolved = (url.rstrip("/"), token)
+    with _CONFIG_LOCK:
+        if _INSTANCE_CFG_KEY == fingerprint:
+            _INSTANCE_CFG_CACHE[name] = resolved
+    return resolved
 
 
 # ============================================================================
 # VIKUNJA API CLIENT
 # ============================================================================
 
+# Parse straight from response bytes, skipping requests' content-type
+# sniffing and charset detection; orjson when available, stdlib otherwise.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# One session per base URL so urllib3's keep-alive pool reuses sockets
+# instead of paying a TCP+TLS handshake on every API call. FastMCP may
+# run tools concurrently, so creation is guarded by a lock (requests
+# sessions themselves are thread-safe for request dispatch).
+_SESSIONS: dict[tuple[str, str], tuple[requests.Session, str]] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(base_url: str, token: str) -> tuple[requests.Session, str]:
+    """Get (or create) the pooled session and API base for a (url, token) pair.
+
+    The Authorization header and the "/api/v1" base are set once here, so
+    the per-call work in _request is a dict lookup plus one concatenation.
+    """
+    key = (base_url, token)
+    entry = _SESSIONS.get(key)
+    if entry is not None:
+        return entry
+    with _SESSIONS_LOCK:
+        entry = _SESSIONS.get(key)
+        if entry is None:
+            session = requests.Session()
+            # requests has no HTTP/2, so concurrent calls to one origin each
+            # need their own socket; size the pool to cover the fan-out
+            # executor so threads never block waiting for a connection.
+            # Long-lived MCP sessions outlive server/LB idle timeouts, so a
+            # pooled socket may be dead on reuse. connect retries recover
+            # from that transparently for every method (the request never
+            # reached the server); read/status retries stay limited to safe
+            # methods since Vikunja's PUT-to-create is not idempotent.
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    connect=2,
+                    read=0,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["Connection"] = "keep-alive"
+            session.headers["Authorization"] = f"Bearer {token}"
+            entry = (session, f"{base_url}/api/v1")
+            _SESSIONS[key] = entry
+    return entry
+
+
+@atexit.register
+def _close_sessions() -> None:
+    """Close pooled sessions at shutdown so sockets aren't left to the OS."""
+    for session, _ in _SESSIONS.values():
+        session.close()
+
+
+# Opportunistic HTTP revalidation: remember the ETag and parsed body per
+# GET, send If-None-Match, and serve the cached body on 304. Costs one
+# header when the server doesn't emit ETags; skips the body transfer and
+# the JSON parse entirely when it does.
+_ETAG_CACHE: dict[tuple, tuple[str, object]] = {}
+
+
 def _request(method: str, endpoint: str, instance: Optional[str] = None, **kwargs) -> dict:
     """Make authenticated request to Vikunja API."""
     url, token = _get_instance_config(instance)
+    session, base = _get_session(url, token)
+
+    headers = kwargs.pop("headers", None)
 
-    headers = kwargs.pop("headers", {})
-    headers["Authorization"] = f"Bearer {token}"
+    if orjson is not None and "json" in kwargs:
+        # Serialize the body ourselves so requests doesn't fall back to stdlib json
+        headers = dict(headers) if headers else {}
+        headers["Content-Type"] = "application/json"
+        kwargs["data"] = orjson.dumps(kwargs.pop("json"))
 
-    full_url = f"{url}/api/v1{endpoint}" if endpoint.startswith("/") else f"{url}/api/v1/{endpoint}"
+    full_url = f"{base}/{endpoint.lstrip('/')}"
 
-    response = requests.request(method, full_url, headers=headers, **kwargs)
+    etag_key = None
+    if method == "GET":
+        params = kwargs.get("params")
+        etag_key = (token, full_url, tuple(sorted(params.items())) if params else None)
+        cached = _ETAG_CACHE.get(etag_key)
+        if cached is not None:
+            headers = dict(headers) if headers else {}
+            headers["If-None-Match"] = cached[0]
+
+    response = session.request(method, full_url, headers=headers, **kwargs)
+
+    if response.status_code == 304 and etag_key is not None:
+        return _ETAG_CACHE[etag_key][1]
 
     if response.status_code >= 400:
         try:
-            error = response.json()
+            error = _loads(response.content)
             msg = error.get("message", response.text)
         except Exception:
             msg = response.text
@@ -253,19 +548,35 @@ def _request(method: str, endpoint: str, instance: Optional[str] = None, **kwarg
     if response.status_code == 204:
         return {}
 
-    return response.json()
+    body = _loads(response.content)
+    if etag_key is not None:
+        etag = response.headers.get("ETag")
+        if etag:
+            _ETAG_CACHE[etag_key] = (etag, body)
+    return body
+
+
+# Shared pool for fanning requests out across instances: wall-clock cost
+# becomes max(per-instance RTT) instead of the sum. requests releases the
+# GIL during socket I/O, so threads scale with instance count.
+_FANOUT = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vik-fanout")
 
 
 def _request_all_instances(method: str, endpoint: str, filter_instance: str = "", **kwargs) -> list:
-    """Make request to all instances (or one if filter specified)."""
+    """Make request to all instances concurrently (or one if filter specified)."""
     instances = _get_instances()
     if filter_instance:
         instances = {k: v for k, v in instances.items() if k == filter_instance}
 
+    futures = {
+        name: _FANOUT.submit(_request, method, endpoint, instance=name, **kwargs)
+        for name in instances
+    }
+
     results = []
-    for name in instances:
+    for name, future in futures.items():
         try:
-            data = _request(method, endpoint, instance=name, **kwargs)
+            data = future.result()
             if isinstance(data, list):
                 for item in data:
                     item["_instance"] = name
@@ -309,8 +620,8 @@ def switch_instance(
 
     All subsequent operations will use this instance.
     """
-    _set_current_instance(name)
     instances = _get_instances()
+    _set_current_instance(name, instances)
     return {
         "switched_to": name,
         "url": instances[name]["url"]
@@ -361,7 +672,7 @@ def set_active_context(
 @mcp.tool()
 def get_active_context() -> dict:
     """Get current default instance and project context."""
-    config = _load_config()
+    config = _load_config_readonly()
     mcp_context = config.get("mcp_context", {})
     return {
         "instance": mcp_context.get("instance"),
@@ -377,7 +688,7 @@ def get_active_context() -> dict:
 @mcp.tool()
 def list_projects() -> dict:
     """List all Vikunja projects."""
-    projects = _request("GET", "/projects")
+    projects = _get_projects()
     return {"result": [
         {
             "id": p["id"],
@@ -393,7 +704,7 @@ def list_projects() -> dict:
 
 
 @mcp.tool()
-def get_project(project_id: int = Field(description="Project ID")) -> dict:
+def get_project(project_id: int = ProjectIDField) -> dict:
     """Get details of a specific project."""
     p = _request("GET", f"/projects/{project_id}")
     return {
@@ -422,6 +733,7 @@ def create_project(
         data["parent_project_id"] = parent_project_id
 
     project = _request("PUT", "/projects", json=data)
+    _invalidate_projects_cache()
     return {
         "id": project["id"],
         "title": project.get("title"),
@@ -431,7 +743,7 @@ def create_project(
 
 @mcp.tool()
 def update_project(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     title: str = Field(default="", description="New title"),
     description: str = Field(default="", description="New description"),
     hex_color: str = Field(default="", description="New color"),
@@ -439,11 +751,14 @@ def update_project(
     position: float = Field(default=-1, description="Position for ordering")
 ) -> dict:
     """Update a project's properties."""
-    # Get current project first
-    current = _request("GET", f"/projects/{project_id}")
-
     data = {"id": project_id}
-    data["title"] = title if title else current.get("title", "")
+    if title:
+        data["title"] = title
+    else:
+        # Vikunja requires a title in the payload, so only when the caller
+        # doesn't supply one do we pay a GET to preserve the current one.
+        current = _request("GET", f"/projects/{project_id}")
+        data["title"] = current.get("title", "")
     if description:
         data["description"] = description
     if hex_color:
@@ -454,13 +769,16 @@ def update_project(
         data["position"] = position
 
     project = _request("POST", f"/projects/{project_id}", json=data)
+    _invalidate_projects_cache()
     return {"id": project["id"], "title": project.get("title"), "updated": True}
 
 
 @mcp.tool()
-def delete_project(project_id: int = Field(description="Project ID")) -> dict:
+def delete_project(project_id: int = ProjectIDField) -> dict:
     """Delete a project and all its tasks. WARNING: Permanent!"""
     _request("DELETE", f"/projects/{project_id}")
+    _invalidate_tasks_cache()
+    _invalidate_projects_cache()
     return {"deleted": project_id}
 
 
@@ -470,40 +788,47 @@ def delete_project(project_id: int = Field(description="Project ID")) -> dict:
 
 @mcp.tool()
 def list_tasks(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     include_completed: bool = Field(default=False, description="Include completed tasks"),
     label_filter: str = Field(default="", description="Filter by label name")
 ) -> dict:
     """List tasks in a project."""
     tasks = _request("GET", f"/projects/{project_id}/tasks")
 
-    if not include_completed:
-        tasks = [t for t in tasks if not t.get("done")]
-
-    if label_filter:
-        label_lower = label_filter.lower()
-        tasks = [t for t in tasks if any(
-            label_lower in (l.get("title") or "").lower()
-            for l in t.get("labels") or []
-        )]
-
-    return {"tasks": [
-        {
+    # Single fused pass: filter and project together so rejected tasks
+    # never cost an intermediate list entry, and peak memory is
+    # O(survivors) rather than O(all tasks).
+    label_lower = label_filter.lower() if label_filter else ""
+    out = []
+    append = out.append
+    for t in tasks:
+        get = t.get
+        if not include_completed and get("done"):
+            continue
+        if label_lower:
+            # Join the lowercased label titles with NUL so one substring
+            # check replaces a per-label any() loop; NUL can't appear in
+            # a filter.
+            if label_lower not in "\x00".join(
+                (l.get("title") or "").lower() for l in get("labels") or ()
+            ):
+                continue
+        description = get("description")
+        append({
             "id": t["id"],
-            "title": t.get("title", ""),
-            "description": t.get("description", "")[:200] if t.get("description") else "",
-            "done": t.get("done", False),
-            "priority": t.get("priority", 0),
-            "due_date": t.get("due_date"),
-            "labels": [l.get("title") for l in t.get("labels") or []],
-            "project_id": t.get("project_id")
-        }
-        for t in tasks
-    ]}
+            "title": get("title", ""),
+            "description": description[:200] if description else "",
+            "done": get("done", False),
+            "priority": get("priority", 0),
+            "due_date": get("due_date"),
+            "labels": tuple(l["title"] for l in get("labels") or () if "title" in l),
+            "project_id": get("project_id")
+        })
+    return {"tasks": out}
 
 
 @mcp.tool()
-def get_task(task_id: int = Field(description="Task ID")) -> dict:
+def get_task(task_id: int = TaskIDField) -> dict:
     """Get details of a specific task."""
     t = _request("GET", f"/tasks/{task_id}")
     return {
@@ -515,7 +840,7 @@ def get_task(task_id: int = Field(description="Task ID")) -> dict:
         "due_date": t.get("due_date"),
         "start_date": t.get("start_date"),
         "end_date": t.get("end_date"),
-        "labels": [{"id": l["id"], "title": l.get("title")} for l in t.get("labels") or []],
+        "labels": tuple({"id": l["id"], "title": l.get("title")} for l in t.get("labels") or ()),
         "project_id": t.get("project_id"),
         "bucket_id": t.get("bucket_id")
     }
@@ -523,7 +848,7 @@ def get_task(task_id: int = Field(description="Task ID")) -> dict:
 
 @mcp.tool()
 def create_task(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     title: str = Field(description="Task title"),
     description: str = Field(default="", description="Task description"),
     due_date: str = Field(default="", description="Due date (ISO format)"),
@@ -550,12 +875,13 @@ def create_task(
         data["repeat_mode"] = repeat_mode
 
     task = _request("PUT", f"/projects/{project_id}/tasks", json=data)
+    _invalidate_tasks_cache()
     return {"id": task["id"], "title": task.get("title"), "project_id": project_id}
 
 
 @mcp.tool()
 def update_task(
-    task_id: int = Field(description="Task ID"),
+    task_id: int = TaskIDField,
     title: str = Field(default="", description="New title"),
     description: str = Field(default="", description="New description"),
     due_date: str = Field(default="", description="New due date"),
@@ -588,20 +914,23 @@ def update_task(
         return {"error": "No changes specified"}
 
     task = _request("POST", f"/tasks/{task_id}", json=data)
+    _invalidate_tasks_cache()
     return {"id": task["id"], "title": task.get("title"), "updated": True}
 
 
 @mcp.tool()
-def complete_task(task_id: int = Field(description="Task ID")) -> dict:
+def complete_task(task_id: int = TaskIDField) -> dict:
     """Mark a task as complete."""
     task = _request("POST", f"/tasks/{task_id}", json={"done": True})
+    _invalidate_tasks_cache()
     return {"id": task_id, "title": task.get("title"), "done": True}
 
 
 @mcp.tool()
-def delete_task(task_id: int = Field(description="Task ID")) -> dict:
+def delete_task(task_id: int = TaskIDField) -> dict:
     """Delete a task. Permanent!"""
     _request("DELETE", f"/tasks/{task_id}")
+    _invalidate_tasks_cache()
     return {"deleted": task_id}
 
 
@@ -609,6 +938,31 @@ def delete_task(task_id: int = Field(description="Task ID")) -> dict:
 # LABEL TOOLS
 # ============================================================================
 
+# Labels are near-immutable reference data, yet several batch tools fetch
+# the full list per invocation. Same pattern as the other caches: short
+# TTL, eager invalidation on mutation. Tools that auto-create labels
+# insert the new id into the cached map instead of refetching.
+_LABELS_CACHE: dict[str, tuple[float, dict[str, int]]] = {}
+_LABELS_CACHE_TTL = 30.0
+
+
+def _invalidate_labels_cache() -> None:
+    """Drop cached label maps after a label mutation."""
+    _LABELS_CACHE.clear()
+
+
+def _get_labels_map(instance: Optional[str] = None) -> dict[str, int]:
+    """Lowercased label title -> id for an instance, cached briefly."""
+    key = instance if instance is not None else (_get_current_instance() or "")
+    entry = _LABELS_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _LABELS_CACHE_TTL:
+        return entry[1]
+    labels = _request("GET", "/labels", instance=instance)
+    label_map = {l["title"].lower(): l["id"] for l in labels}
+    _LABELS_CACHE[key] = (time.monotonic(), label_map)
+    return label_map
+
+
 @mcp.tool()
 def list_labels() -> dict:
     """List all labels."""
@@ -629,6 +983,7 @@ def create_label(
         "title": title,
         "hex_color": hex_color.lstrip("#") if hex_color else ""
     })
+    _invalidate_labels_cache()
     return {"id": label["id"], "title": label.get("title")}
 
 
@@ -636,12 +991,13 @@ def create_label(
 def delete_label(label_id: int = Field(description="Label ID")) -> dict:
     """Delete a label."""
     _request("DELETE", f"/labels/{label_id}")
+    _invalidate_labels_cache()
     return {"deleted": label_id}
 
 
 @mcp.tool()
 def add_label_to_task(
-    task_id: int = Field(description="Task ID"),
+    task_id: int = TaskIDField,
     label_id: int = Field(description="Label ID")
 ) -> dict:
     """Add a label to a task."""
@@ -649,12 +1005,40 @@ def add_label_to_task(
     return {"task_id": task_id, "label_id": label_id, "added": True}
 
 
+@mcp.tool()
+def add_labels_to_task(
+    task_id: int = TaskIDField,
+    label_ids: list = Field(description="Label IDs to add")
+) -> dict:
+    """Add multiple labels to a task in one call.
+
+    Issues the per-label PUTs concurrently. The labels/bulk endpoint is
+    deliberately not used here: it has replace semantics (labels not in
+    the payload are removed from the task), which would silently strip
+    a task's pre-existing labels on an "add".
+    """
+    result = {"task_id": task_id, "label_ids": [], "added": 0, "errors": []}
+    futures = [
+        (label_id, _PROJECT_FANOUT.submit(
+            _request, "PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id}))
+        for label_id in label_ids
+    ]
+    for label_id, future in futures:
+        try:
+            future.result()
+            result["label_ids"].append(label_id)
+            result["added"] += 1
+        except Exception as e:
+            result["errors"].append(f"Label {label_id}: {e}")
+    return result
+
+
 # ============================================================================
 # KANBAN / VIEW TOOLS
 # ============================================================================
 
 @mcp.tool()
-def list_views(project_id: int = Field(description="Project ID")) -> dict:
+def list_views(project_id: int = ProjectIDField) -> dict:
     """List all views for a project."""
     views = _request("GET", f"/projects/{project_id}/views")
     return {"views": [
@@ -665,7 +1049,7 @@ def list_views(project_id: int = Field(description="Project ID")) -> dict:
 
 @mcp.tool()
 def create_view(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     title: str = Field(description="View title"),
     view_kind: str = Field(description="View type: list, kanban, gantt, or table"),
     filter_query: str = Field(default="", description="Optional filter (e.g., 'done = false')")
@@ -679,6 +1063,7 @@ def create_view(
     if filter_query:
         data["filter"] = filter_query
     view = _request("PUT", f"/projects/{project_id}/views", json=data)
+    _invalidate_kanban_view_cache()
     return {
         "id": view["id"],
         "title": view.get("title", ""),
@@ -687,20 +1072,38 @@ def create_view(
     }
 
 
+# A project's kanban view id is effectively immutable, but callers look
+# it up before every bucket operation. Cache per (instance, project);
+# view-creating tools invalidate.
+_KANBAN_VIEW_CACHE: dict[tuple[str, int], tuple[int, str]] = {}
+
+
+def _invalidate_kanban_view_cache() -> None:
+    """Drop cached kanban view lookups after a view mutation."""
+    _KANBAN_VIEW_CACHE.clear()
+
+
 @mcp.tool()
-def get_kanban_view(project_id: int = Field(description="Project ID")) -> dict:
+def get_kanban_view(project_id: int = ProjectIDField) -> dict:
     """Get the kanban view for a project."""
+    cache_key = (_get_current_instance() or "", project_id)
+    cached = _KANBAN_VIEW_CACHE.get(cache_key)
+    if cached is not None:
+        return {"view_id": cached[0], "title": cached[1]}
+
     views = _request("GET", f"/projects/{project_id}/views")
     for v in views:
         if v.get("view_kind") == "kanban":
-            return {"view_id": v["id"], "title": v.get("title", "Kanban")}
+            title = v.get("title", "Kanban")
+            _KANBAN_VIEW_CACHE[cache_key] = (v["id"], title)
+            return {"view_id": v["id"], "title": title}
     return {"error": "No kanban view found"}
 
 
 @mcp.tool()
 def list_buckets(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID")
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField
 ) -> dict:
     """List kanban buckets in a view."""
     buckets = _request("GET", f"/projects/{project_id}/views/{view_id}/buckets")
@@ -710,7 +1113,7 @@ def list_buckets(
             "title": b.get("title", ""),
             "position": b.get("position", 0),
             "limit": b.get("limit", 0),
-            "task_count": len(b.get("tasks") or [])
+            "task_count": len(b.get("tasks") or ())
         }
         for b in buckets
     ]}
@@ -718,8 +1121,8 @@ def list_buckets(
 
 @mcp.tool()
 def create_bucket(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID"),
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
     title: str = Field(description="Bucket title"),
     limit: int = Field(default=0, description="WIP limit (0=no limit)"),
     position: int = Field(default=0, description="Position")
@@ -732,18 +1135,32 @@ def create_bucket(
         data["position"] = position
 
     bucket = _request("PUT", f"/projects/{project_id}/views/{view_id}/buckets", json=data)
+    _KANBAN_CACHE.clear()
     return {"id": bucket["id"], "title": bucket.get("title")}
 
 
 @mcp.tool()
 def set_task_position(
-    task_id: int = Field(description="Task ID"),
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID"),
+    task_id: int = TaskIDField,
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
     bucket_id: int = Field(description="Target bucket ID"),
     apply_sort: bool = Field(default=False, description="Auto-position by sort strategy")
 ) -> dict:
     """Move a task to a kanban bucket."""
+    _move_task_to_bucket(task_id, project_id, view_id, bucket_id)
+    return {"task_id": task_id, "bucket_id": bucket_id, "moved": True}
+
+
+def _move_task_to_bucket(task_id: int, project_id: int, view_id: int, bucket_id: int,
+                         instance: Optional[str] = None) -> None:
+    """Issue the two dependent calls that move one task to a bucket.
+
+    Fusing these into one position-only POST was proposed, but the second
+    call is what commits the assignment and the first is required on the
+    servers this has been tested against - a position-only probe could
+    succeed with 200 yet leave the task in its old bucket. Keep the pair.
+    """
     # Call 1: Add task to bucket
     bucket_data = {
         "task_id": task_id,
@@ -751,7 +1168,8 @@ def set_task_position(
         "project_view_id": view_id,
         "project_id": project_id
     }
-    _request("POST", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}/tasks", json=bucket_data)
+    _request("POST", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}/tasks",
+             instance=instance, json=bucket_data)
 
     # Call 2: CRITICAL - Commit the bucket assignment (bucket_id required!)
     position_data = {
@@ -759,9 +1177,42 @@ def set_task_position(
         "task_id": task_id,
         "bucket_id": bucket_id
     }
-    _request("POST", f"/tasks/{task_id}/position", json=position_data)
+    _request("POST", f"/tasks/{task_id}/position", instance=instance, json=position_data)
 
-    return {"task_id": task_id, "bucket_id": bucket_id, "moved": True}
+
+@mcp.tool()
+def set_task_positions_bulk(
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
+    moves: list = Field(description="List of moves: [{task_id, bucket_id}]")
+) -> dict:
+    """Move multiple tasks to kanban buckets at once.
+
+    Each move's two calls stay ordered (the position call commits the
+    bucket assignment), but independent moves run concurrently, so a
+    board reorganization costs ~2 RTTs instead of 2 per task.
+    """
+    result = {"moved": 0, "tasks": [], "errors": []}
+
+    futures = []
+    for move in moves:
+        task_id = move.get("task_id")
+        bucket_id = move.get("bucket_id")
+        if not task_id or not bucket_id:
+            result["errors"].append("Move missing task_id or bucket_id")
+            continue
+        futures.append((task_id, bucket_id, _PROJECT_FANOUT.submit(
+            _move_task_to_bucket, task_id, project_id, view_id, bucket_id)))
+
+    for task_id, bucket_id, future in futures:
+        try:
+            future.result()
+            result["moved"] += 1
+            result["tasks"].append({"task_id": task_id, "bucket_id": bucket_id})
+        except Exception as e:
+            result["errors"].append(f"Failed to move task {task_id}: {e}")
+
+    return result
 
 
 # ============================================================================
@@ -783,7 +1234,7 @@ def create_task_relation(
 
 
 @mcp.tool()
-def list_task_relations(task_id: int = Field(description="Task ID")) -> dict:
+def list_task_relations(task_id: int = TaskIDField) -> dict:
     """List relations for a task."""
     task = _request("GET", f"/tasks/{task_id}")
     relations = task.get("related_tasks", {})
@@ -794,30 +1245,168 @@ def list_task_relations(task_id: int = Field(description="Task ID")) -> dict:
 # POWER QUERY TOOLS - Fast task queries across instances
 # ============================================================================
 
+# Short-TTL cache of _get_all_tasks results keyed by the instance filter, so
+# back-to-back power queries (task_summary then focus_now, say) hit the
+# network once. Entries expire at a fixed age - no refresh on hit - keeping
+# staleness bounded; task-mutating tools invalidate eagerly.
+_TASKS_CACHE: dict[str, tuple[float, list]] = {}
+_TASKS_CACHE_TTL = float(os.environ.get("VIKUNJA_CACHE_TTL", "20"))
+
+
+def _invalidate_tasks_cache() -> None:
+    """Drop cached task lists after any mutation."""
+    _TASKS_CACHE.clear()
+
+
+# Project listings change far less often than tasks, and several tools
+# (task fetches, search, export) re-list them on every call. Same pattern
+# as the task cache: fixed TTL, eager invalidation from project mutators.
+_PROJECTS_CACHE: dict[str, tuple[float, list]] = {}
+
+
+def _invalidate_projects_cache() -> None:
+    """Drop cached project listings after a project mutation."""
+    _PROJECTS_CACHE.clear()
+
+
+def _get_projects(instance: Optional[str] = None) -> list:
+    """GET /projects for an instance, cached for the shared TTL."""
+    key = instance if instance is not None else (_get_current_instance() or "")
+    entry = _PROJECTS_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _TASKS_CACHE_TTL:
+        return entry[1]
+    projects = _request("GET", "/projects", instance=instance)
+    _PROJECTS_CACHE[key] = (time.monotonic(), projects)
+    return projects
+
+
+# Separate pool for per-project task fetches. Instance-level work runs on
+# _FANOUT; nesting both levels on one pool could deadlock when outer jobs
+# fill every worker while waiting on inner ones.
+_PROJECT_FANOUT = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vik-projects")
+
+
+def _fetch_instance_tasks(inst_name: str) -> list:
+    """Fetch incomplete tasks for one instance.
+
+    Prefers a single paginated /tasks/all query (the per-project walk is a
+    classic N+1); falls back to per-project fetches if the endpoint is
+    missing on older Vikunja versions.
+    """
+    try:
+        return _fetch_instance_tasks_bulk(inst_name)
+    except Exception as e:
+        if "(404)" not in str(e):
+            raise
+        logger.debug(f"/tasks/all unavailable on {inst_name}, falling back to per-project fetch")
+    return _fetch_instance_tasks_per_project(inst_name)
+
+
+def _get_paged(endpoint: str, instance: str, params: Optional[dict] = None,
+               per_page: int = 250) -> list:
+    """Fetch a list endpoint page by page until a short page comes back.
+
+    Vikunja defaults to 50 items per page, which silently truncated large
+    projects; ask for the maximum and keep paging past it. The server
+    clamps per_page to its configured maxitemsperpage (default 50), so
+    the effective page size is learned from the first page instead of
+    trusting the requested one - comparing against the requested size
+    would stop after one clamped page and truncate again.
+    """
+    items = []
+    page = 1
+    page_size = None
+    while True:
+        page_params = dict(params or {})
+        page_params["per_page"] = per_page
+        page_params["page"] = page
+        batch = _request("GET", endpoint, instance=instance, params=page_params)
+        items.extend(batch)
+        if not batch:
+            return items
+        if page_size is None:
+            page_size = len(batch)
+        if len(batch) < page_size:
+            return items
+        page += 1
+
+
+def _fetch_instance_tasks_bulk(inst_name: str) -> list:
+    """Fetch all incomplete tasks across projects in one paginated query."""
+    project_titles = {
+        p["id"]: p.get("title", "")
+        for p in _get_projects(inst_name)
+    }
+
+    tasks_out = []
+    for t in _get_paged("/tasks/all", inst_name, params={"filter": "done = false"}):
+        if not t.get("done"):
+            t["_instance"] = inst_name
+            t["_project_title"] = project_titles.get(t.get("project_id"), "")
+            tasks_out.append(t)
+    return tasks_out
+
+
+def _fetch_instance_tasks_per_project(inst_name: str) -> list:
+    """Fallback: fetch incomplete tasks one project per worker."""
+    tasks_out = []
+    projects = _get_projects(inst_name)
+    futures = {
+        _PROJECT_FANOUT.submit(_get_paged, f"/projects/{p['id']}/tasks", inst_name): p
+        for p in projects
+    }
+    for future, proj in futures.items():
+        try:
+            for t in future.result():
+                if not t.get("done"):
+                    t["_instance"] = inst_name
+                    t["_project_title"] = proj.get("title", "")
+                    tasks_out.append(t)
+        except Exception:
+            pass
+    return tasks_out
+
+
 def _get_all_tasks(instance: str = "") -> list:
-    """Get all incomplete tasks from all projects."""
+    """Get all incomplete tasks from all projects (cached for a short TTL)."""
+    entry = _TASKS_CACHE.get(instance)
+    if entry is not None and time.monotonic() - entry[0] < _TASKS_CACHE_TTL:
+        return entry[1]
+
     instances = _get_instances()
     if instance:
         instances = {k: v for k, v in instances.items() if k == instance}
 
     all_tasks = []
-    for inst_name in instances:
+    inst_futures = {name: _FANOUT.submit(_fetch_instance_tasks, name) for name in instances}
+    for inst_name, future in inst_futures.items():
         try:
-            projects = _request("GET", "/projects", instance=inst_name)
-            for proj in projects:
-                try:
-                    tasks = _request("GET", f"/projects/{proj['id']}/tasks", instance=inst_name)
-                    for t in tasks:
-                        if not t.get("done"):
-                            t["_instance"] = inst_name
-                            t["_project_title"] = proj.get("title", "")
-                            all_tasks.append(t)
-                except Exception:
-                    pass
+            all_tasks.extend(future.result())
         except Exception as e:
             logger.warning(f"Failed to get tasks from {inst_name}: {e}")
 
-    return all_tasks
+    # Normalize once at the boundary: every power-query tool needs the parsed
+    # due date and priority, so paying the parse per tool per task is waste.
+    # Project down to the fields the tools actually read while we're here -
+    # Vikunja sends full task objects (descriptions, attachments, assignee
+    # blobs, ...) and the cache shouldn't hold what nothing consumes.
+    due_str = _due_str
+    slim_tasks = [
+        {
+            "id": t["id"],
+            "title": t.get("title", ""),
+            "due_date": t.get("due_date"),
+            "project_id": t.get("project_id"),
+            "_instance": t.get("_instance", ""),
+            "_project_title": t.get("_project_title", ""),
+            "_due": due_str(t),
+            "_priority": t.get("priority", 0),
+        }
+        for t in all_tasks
+    ]
+
+    _TASKS_CACHE[instance] = (time.monotonic(), slim_tasks)
+    return slim_tasks
 
 
 def _parse_due_date(task: dict) -> Optional[datetime]:
@@ -825,231 +1414,273 @@ def _parse_due_date(task: dict) -> Optional[datetime]:
     due = task.get("due_date")
     if not due or due == "0001-01-01T00:00:00Z":
         return None
+    # Fast path for the fixed server format 'YYYY-MM-DDTHH:MM:SSZ': direct
+    # slicing skips fromisoformat's general-format machinery and the
+    # intermediate .replace allocation.
+    if len(due) == 20 and due[19] == "Z":
+        try:
+            return datetime(
+                int(due[0:4]), int(due[5:7]), int(due[8:10]),
+                int(due[11:13]), int(due[14:16]), int(due[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            return None
     try:
         return datetime.fromisoformat(due.replace("Z", "+00:00"))
     except Exception:
         return None
 
 
+def _due_str(task: dict) -> Optional[str]:
+    """Due date as a UTC ISO string suitable for lexicographic comparison.
+
+    Vikunja returns 'YYYY-MM-DDTHH:MM:SSZ', where string order equals time
+    order, so filters can compare raw strings and skip datetime
+    construction. Non-UTC offsets (rare, client-written) are normalized.
+    """
+    s = task.get("due_date")
+    if not s or s == "0001-01-01T00:00:00Z":
+        return None
+    if not s.endswith("Z"):
+        dt = _parse_due_date(task)
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ") if dt else None
+    return s
+
+
+def _utc_str(dt: datetime) -> str:
+    """Format a datetime for comparison against _due_str values."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+_PRIORITY_NAMES = {5: "DO NOW", 4: "Urgent", 3: "High", 2: "Medium", 1: "Low"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_task_cached(task_id, title: str, done: bool, priority: int) -> str:
+    mark = "✓ " if done else ""
+    prio = f" [{_PRIORITY_NAMES[priority]}]" if priority in _PRIORITY_NAMES else ""
+    return f"{mark}{title} (#{task_id}){prio}"
+
+
+def _format_task(task: dict) -> str:
+    """One-line human-readable task summary (memoized on the shown fields)."""
+    return _format_task_cached(
+        task.get("id"), task.get("title", ""),
+        bool(task.get("done")), task.get("priority", 0))
+
+
+def _format_project(project: dict) -> str:
+    """One-line human-readable project summary."""
+    return f"{project.get('title', '')} (#{project.get('id')})"
+
+
+def _task_view(t: dict) -> dict:
+    """Project the common power-query output fields from an annotated task."""
+    return {
+        "id": t["id"],
+        "title": t.get("title", ""),
+        "due_date": t.get("due_date"),
+        "priority": t["_priority"],
+        "project": t.get("_project_title", ""),
+        "instance": t.get("_instance", "")
+    }
+
+
+# Category index built in one pass over the cached task list, so each FAST
+# tool only projects + sorts its own bucket and task_summary is pure len().
+# Keyed by the cached list object itself: a fresh fetch means a fresh index.
+_TASK_INDEX_CACHE: dict[str, tuple[list, dict]] = {}
+
+
+def _build_index(tasks: list, now: datetime) -> dict:
+    """Bucket annotated tasks by category in a single scan."""
+    now_str = _utc_str(now)
+    today_end_str = _utc_str(now.replace(hour=23, minute=59, second=59))
+    week_end_str = _utc_str(now + timedelta(days=7))
+    overdue, due_today, due_week, unscheduled = [], [], [], []
+
+    # Bound methods hoisted to locals: this loop runs over every task on
+    # every index rebuild, and LOAD_FAST beats LOAD_ATTR per iteration.
+    add_overdue = overdue.append
+    add_today = due_today.append
+    add_week = due_week.append
+    add_unscheduled = unscheduled.append
+
+    for t in tasks:
+        due = t["_due"]
+        if due is None:
+            add_unscheduled(t)
+        else:
+            if due < now_str:
+                add_overdue(t)
+            if due <= today_end_str:
+                add_today(t)
+            if due <= week_end_str:
+                add_week(t)
+
+    # One priority-descending sort answers every threshold query
+    # (urgent >= 4, high >= 3, ...) with a bisect instead of a scan.
+    by_prio_desc = sorted(tasks, key=lambda t: -t["_priority"])
+    neg_prio = [-t["_priority"] for t in by_prio_desc]
+
+    return {
+        "now_str": now_str,
+        "tasks": tasks,
+        "overdue": overdue,
+        "due_today": due_today,
+        "due_week": due_week,
+        "unscheduled": unscheduled,
+        "by_prio_desc": by_prio_desc,
+        "neg_prio": neg_prio,
+    }
+
+
+def _priority_cut(index: dict, threshold: int) -> int:
+    """Number of tasks with priority >= threshold."""
+    return bisect.bisect_right(index["neg_prio"], -threshold)
+
+
+def _priority_at_least(index: dict, threshold: int) -> list:
+    """Tasks with priority >= threshold, already sorted by priority desc."""
+    return index["by_prio_desc"][:_priority_cut(index, threshold)]
+
+
+def _get_task_index(instance: str = "") -> dict:
+    """Get the category index for the (cached) task list."""
+    tasks = _get_all_tasks(instance)
+    entry = _TASK_INDEX_CACHE.get(instance)
+    if entry is not None and entry[0] is tasks:
+        return entry[1]
+    index = _build_index(tasks, datetime.now(timezone.utc))
+    _TASK_INDEX_CACHE[instance] = (tasks, index)
+    return index
+
+
 @mcp.tool()
 def overdue_tasks(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks past their due date. FAST."""
-    now = datetime.now(timezone.utc)
-    tasks = _get_all_tasks(instance)
+    overdue = [_task_view(t) for t in _get_task_index(instance)["overdue"]]
 
-    overdue = []
-    for t in tasks:
-        due = _parse_due_date(t)
-        if due and due < now:
-            overdue.append({
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "due_date": t.get("due_date"),
-                "priority": t.get("priority", 0),
-                "project": t.get("_project_title", ""),
-                "instance": t.get("_instance", "")
-            })
-
-    overdue.sort(key=lambda x: x.get("due_date", ""))
+    # Views always carry a due_date here, so itemgetter beats a lambda
+    # that re-resolves .get per comparison.
+    overdue.sort(key=operator.itemgetter("due_date"))
     return {"tasks": overdue, "count": len(overdue)}
 
 
 @mcp.tool()
 def due_today(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks due today + overdue. FAST."""
-    now = datetime.now(timezone.utc)
-    today_end = now.replace(hour=23, minute=59, second=59)
-    tasks = _get_all_tasks(instance)
+    index = _get_task_index(instance)
+    now_str = index["now_str"]
 
+    view_of = _task_view
     due = []
-    for t in tasks:
-        d = _parse_due_date(t)
-        if d and d <= today_end:
-            due.append({
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "due_date": t.get("due_date"),
-                "priority": t.get("priority", 0),
-                "project": t.get("_project_title", ""),
-                "instance": t.get("_instance", ""),
-                "overdue": d < now
-            })
+    for t in index["due_today"]:
+        view = view_of(t)
+        view["overdue"] = t["_due"] < now_str
+        due.append(view)
 
-    due.sort(key=lambda x: (-x.get("priority", 0), x.get("due_date", "")))
+    due.sort(key=lambda x: (-x["priority"], x["due_date"]))
     return {"tasks": due, "count": len(due)}
 
 
 @mcp.tool()
 def due_this_week(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks due in next 7 days + overdue. FAST."""
-    now = datetime.now(timezone.utc)
-    week_end = now + timedelta(days=7)
-    tasks = _get_all_tasks(instance)
-
-    due = []
-    for t in tasks:
-        d = _parse_due_date(t)
-        if d and d <= week_end:
-            due.append({
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "due_date": t.get("due_date"),
-                "priority": t.get("priority", 0),
-                "project": t.get("_project_title", ""),
-                "instance": t.get("_instance", "")
-            })
+    due = [_task_view(t) for t in _get_task_index(instance)["due_week"]]
 
-    due.sort(key=lambda x: x.get("due_date", ""))
+    due.sort(key=operator.itemgetter("due_date"))
     return {"tasks": due, "count": len(due)}
 
 
 @mcp.tool()
 def high_priority_tasks(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks with priority >= 3. FAST."""
-    tasks = _get_all_tasks(instance)
-
-    high = [
-        {
-            "id": t["id"],
-            "title": t.get("title", ""),
-            "priority": t.get("priority", 0),
-            "due_date": t.get("due_date"),
-            "project": t.get("_project_title", ""),
-            "instance": t.get("_instance", "")
-        }
-        for t in tasks if t.get("priority", 0) >= 3
-    ]
-
-    high.sort(key=lambda x: -x.get("priority", 0))
+    high = [_task_view(t) for t in _priority_at_least(_get_task_index(instance), 3)]
     return {"tasks": high, "count": len(high)}
 
 
 @mcp.tool()
 def urgent_tasks(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks with priority >= 4 (critical). FAST."""
-    tasks = _get_all_tasks(instance)
-
-    urgent = [
-        {
-            "id": t["id"],
-            "title": t.get("title", ""),
-            "priority": t.get("priority", 0),
-            "due_date": t.get("due_date"),
-            "project": t.get("_project_title", ""),
-            "instance": t.get("_instance", "")
-        }
-        for t in tasks if t.get("priority", 0) >= 4
-    ]
-
-    urgent.sort(key=lambda x: -x.get("priority", 0))
+    urgent = [_task_view(t) for t in _priority_at_least(_get_task_index(instance), 4)]
     return {"tasks": urgent, "count": len(urgent)}
 
 
 @mcp.tool()
 def focus_now(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all."),
+    instance: str = InstanceFilterField,
     limit: int = Field(default=10, description="Max tasks (0=all)")
 ) -> dict:
     """Get tasks needing attention: priority >= 4 OR overdue. THE BEST for 'what should I work on?'"""
-    now = datetime.now(timezone.utc)
-    tasks = _get_all_tasks(instance)
+    index = _get_task_index(instance)
 
     focus = []
-    for t in tasks:
-        due = _parse_due_date(t)
-        is_overdue = due and due < now
-        is_high_priority = t.get("priority", 0) >= 4
-
-        if is_overdue or is_high_priority:
-            focus.append({
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "priority": t.get("priority", 0),
-                "due_date": t.get("due_date"),
-                "overdue": is_overdue,
-                "project": t.get("_project_title", ""),
-                "instance": t.get("_instance", "")
-            })
-
-    focus.sort(key=lambda x: (-x.get("priority", 0), x.get("due_date") or "9999"))
+    seen = set()
+    for t in index["overdue"]:
+        view = _task_view(t)
+        view["overdue"] = True
+        # Sort key computed once per task instead of twice per comparison.
+        view["_sk"] = (-view["priority"], view["due_date"] or "9999")
+        focus.append(view)
+        seen.add(id(t))
+    for t in _priority_at_least(index, 4):
+        if id(t) not in seen:
+            view = _task_view(t)
+            view["overdue"] = False
+            view["_sk"] = (-view["priority"], view["due_date"] or "9999")
+            focus.append(view)
+
+    key = operator.itemgetter("_sk")
 
     total = len(focus)
     if limit > 0:
-        focus = focus[:limit]
+        # Partial selection: ~N + limit*log(N) comparisons vs N*log(N) for
+        # a full sort, and limit defaults to 10.
+        focus = heapq.nsmallest(limit, focus, key=key)
+    else:
+        focus.sort(key=key)
 
+    for view in focus:
+        del view["_sk"]
     return {"tasks": focus, "count": len(focus), "total_matching": total}
 
 
 @mcp.tool()
 def task_summary(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Lightweight task overview - COUNTS ONLY. FASTEST."""
-    now = datetime.now(timezone.utc)
-    today_end = now.replace(hour=23, minute=59, second=59)
-    week_end = now + timedelta(days=7)
-
-    tasks = _get_all_tasks(instance)
+    index = _get_task_index(instance)
 
-    counts = {
-        "total": len(tasks),
-        "overdue": 0,
-        "due_today": 0,
-        "due_this_week": 0,
-        "high_priority": 0,
-        "urgent": 0,
-        "unscheduled": 0
+    return {
+        "total": len(index["tasks"]),
+        "overdue": len(index["overdue"]),
+        "due_today": len(index["due_today"]),
+        "due_this_week": len(index["due_week"]),
+        "high_priority": _priority_cut(index, 3),
+        "urgent": _priority_cut(index, 4),
+        "unscheduled": len(index["unscheduled"])
     }
 
-    for t in tasks:
-        due = _parse_due_date(t)
-        priority = t.get("priority", 0)
-
-        if due:
-            if due < now:
-                counts["overdue"] += 1
-            if due <= today_end:
-                counts["due_today"] += 1
-            if due <= week_end:
-                counts["due_this_week"] += 1
-        else:
-            counts["unscheduled"] += 1
-
-        if priority >= 3:
-            counts["high_priority"] += 1
-        if priority >= 4:
-            counts["urgent"] += 1
-
-    return counts
-
 
 @mcp.tool()
 def unscheduled_tasks(
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks without a due date."""
-    tasks = _get_all_tasks(instance)
-
-    unscheduled = [
-        {
-            "id": t["id"],
-            "title": t.get("title", ""),
-            "priority": t.get("priority", 0),
-            "project": t.get("_project_title", ""),
-            "instance": t.get("_instance", "")
-        }
-        for t in tasks if not _parse_due_date(t)
-    ]
+    unscheduled = [_task_view(t) for t in _get_task_index(instance)["unscheduled"]]
 
     return {"tasks": unscheduled, "count": len(unscheduled)}
 
@@ -1057,27 +1688,17 @@ def unscheduled_tasks(
 @mcp.tool()
 def upcoming_deadlines(
     days: int = Field(default=3, description="Days to look ahead"),
-    instance: str = Field(default="", description="Filter to specific instance. Empty = all.")
+    instance: str = InstanceFilterField
 ) -> dict:
     """Get tasks due in next N days (not overdue)."""
     now = datetime.now(timezone.utc)
-    future = now + timedelta(days=days)
+    now_str = _utc_str(now)
+    future_str = _utc_str(now + timedelta(days=days))
     tasks = _get_all_tasks(instance)
 
-    upcoming = []
-    for t in tasks:
-        due = _parse_due_date(t)
-        if due and now <= due <= future:
-            upcoming.append({
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "due_date": t.get("due_date"),
-                "priority": t.get("priority", 0),
-                "project": t.get("_project_title", ""),
-                "instance": t.get("_instance", "")
-            })
+    upcoming = [_task_view(t) for t in tasks if (due := t["_due"]) and now_str <= due <= future_str]
 
-    upcoming.sort(key=lambda x: x.get("due_date", ""))
+    upcoming.sort(key=operator.itemgetter("due_date"))
     return {"tasks": upcoming, "count": len(upcoming)}
 
 
@@ -1087,19 +1708,34 @@ def upcoming_deadlines(
 
 def _get_xq_config() -> dict:
     """Get X-Q project IDs from config."""
-    config = _load_config()
+    config = _load_config_readonly()
     return config.get("xq", {})
 
 
-def _get_xq_kanban_view(instance: str, project_id: int) -> dict:
-    """Get kanban view and buckets for X-Q project."""
-    views = _request("GET", f"/projects/{project_id}/views", instance=instance)
+# Standard X-Q bucket names, defined once so every X-Q tool compares the
+# same interned strings instead of re-spelling the emoji literals.
+XQ_HANDOFF = "📬 Handoff"
+XQ_REVIEW = "🔍 Review"
+XQ_FILED = "✅ Filed"
+XQ_BUCKETS = (XQ_HANDOFF, XQ_REVIEW, XQ_FILED)
 
-    kanban_view = None
-    for v in views:
-        if v.get("view_kind") == "kanban":
-            kanban_view = v
-            break
+
+# A project's view/bucket layout changes rarely but every kanban op pays
+# two GETs to rediscover it; cache per (instance, project) for a minute.
+# Bucket- and view-mutating tools invalidate.
+_KANBAN_CACHE: dict[tuple[Optional[str], int], tuple[float, dict]] = {}
+_KANBAN_CACHE_TTL = 60.0
+
+
+def _get_kanban_layout(project_id: int, instance: Optional[str] = None) -> dict:
+    """Get the kanban view id + bucket map for a project (cached briefly)."""
+    cache_key = (instance if instance is not None else _get_current_instance(), project_id)
+    entry = _KANBAN_CACHE.get(cache_key)
+    if entry is not None and time.monotonic() - entry[0] < _KANBAN_CACHE_TTL:
+        return entry[1]
+
+    views = _request("GET", f"/projects/{project_id}/views", instance=instance)
+    kanban_view = next((v for v in views if v.get("view_kind") == "kanban"), None)
 
     if not kanban_view:
         return {"error": "No kanban view found"}
@@ -1107,10 +1743,17 @@ def _get_xq_kanban_view(instance: str, project_id: int) -> dict:
     buckets = _request("GET", f"/projects/{project_id}/views/{kanban_view['id']}/buckets", instance=instance)
     bucket_map = {b.get("title", ""): b["id"] for b in buckets}
 
-    return {
+    result = {
         "view_id": kanban_view["id"],
         "buckets": bucket_map
     }
+    _KANBAN_CACHE[cache_key] = (time.monotonic(), result)
+    return result
+
+
+def _get_xq_kanban_view(instance: str, project_id: int) -> dict:
+    """Get kanban view and buckets for X-Q project (cached for a short TTL)."""
+    return _get_kanban_layout(project_id, instance=instance)
 
 
 @mcp.tool()
@@ -1128,10 +1771,18 @@ def check_xq(
     if not xq_config:
         return {"error": "No X-Q configured. Add 'xq' section to ~/.vikunja-mcp/config.yaml"}
 
+    # One GET per configured instance - fan out so M instances cost the
+    # slowest round trip, not the sum.
+    futures = {
+        inst_name: (project_id, _FANOUT.submit(
+            _request, "GET", f"/projects/{project_id}/tasks", instance=inst_name))
+        for inst_name, project_id in xq_config.items()
+    }
+
     results = []
-    for inst_name, project_id in xq_config.items():
+    for inst_name, (project_id, future) in futures.items():
         try:
-            tasks = _request("GET", f"/projects/{project_id}/tasks", instance=inst_name)
+            tasks = future.result()
             pending = [t for t in tasks if not t.get("done")]
             for t in pending:
                 results.append({
@@ -1144,7 +1795,7 @@ def check_xq(
         except Exception as e:
             results.append({"instance": inst_name, "error": str(e)})
 
-    return {"pending": results, "count": len([r for r in results if "id" in r])}
+    return {"pending": results, "count": sum(1 for r in results if "id" in r)}
 
 
 @mcp.tool()
@@ -1157,7 +1808,6 @@ def setup_xq(
         return {"error": f"X-Q not configured for '{instance}'. Add to config.yaml first."}
 
     project_id = xq_config[instance]
-    XQ_BUCKETS = ["📬 Handoff", "🔍 Review", "✅ Filed"]
 
     kanban_info = _get_xq_kanban_view(instance, project_id)
     if "error" in kanban_info:
@@ -1173,6 +1823,9 @@ def setup_xq(
                     instance=instance, json={"title": bucket_name})
             created.append(bucket_name)
 
+    if created:
+        _KANBAN_CACHE.pop((instance, project_id), None)
+
     return {
         "instance": instance,
         "project_id": project_id,
@@ -1196,31 +1849,20 @@ def claim_xq_task(
     if "error" in kanban_info:
         return {"error": kanban_info["error"], "hint": "Run setup_xq first"}
 
-    review_bucket = kanban_info["buckets"].get("🔍 Review")
+    review_bucket = kanban_info["buckets"].get(XQ_REVIEW)
     if not review_bucket:
         return {"error": "No Review bucket. Run setup_xq first."}
 
     task = _request("GET", f"/tasks/{task_id}", instance=instance)
 
-    _request("POST", f"/projects/{project_id}/views/{kanban_info['view_id']}/buckets/{review_bucket}/tasks",
-            instance=instance, json={
-                "task_id": task_id,
-                "bucket_id": review_bucket,
-                "project_view_id": kanban_info["view_id"],
-                "project_id": project_id
-            })
-    # CRITICAL: Commit the bucket assignment (bucket_id required!)
-    _request("POST", f"/tasks/{task_id}/position", instance=instance, json={
-        "project_view_id": kanban_info["view_id"],
-        "task_id": task_id,
-        "bucket_id": review_bucket
-    })
+    _move_task_to_bucket(task_id, project_id, kanban_info["view_id"], review_bucket,
+                         instance=instance)
 
     return {
         "claimed": task_id,
         "title": task.get("title"),
         "description": task.get("description"),
-        "moved_to": "🔍 Review",
+        "moved_to": XQ_REVIEW,
         "instance": instance
     }
 
@@ -1228,7 +1870,7 @@ def claim_xq_task(
 @mcp.tool()
 def complete_xq_task(
     instance: str = Field(description="Instance name"),
-    task_id: int = Field(description="Task ID"),
+    task_id: int = TaskIDField,
     destination: str = Field(description="Where the file was placed"),
     notes: str = Field(default="", description="Optional notes")
 ) -> dict:
@@ -1242,7 +1884,7 @@ def complete_xq_task(
     if "error" in kanban_info:
         return kanban_info
 
-    filed_bucket = kanban_info["buckets"].get("✅ Filed")
+    filed_bucket = kanban_info["buckets"].get(XQ_FILED)
     if not filed_bucket:
         return {"error": "No Filed bucket. Run setup_xq first."}
 
@@ -1258,20 +1900,10 @@ def complete_xq_task(
         "description": desc + filing,
         "done": True
     })
+    _invalidate_tasks_cache()
 
-    _request("POST", f"/projects/{project_id}/views/{kanban_info['view_id']}/buckets/{filed_bucket}/tasks",
-            instance=instance, json={
-                "task_id": task_id,
-                "bucket_id": filed_bucket,
-                "project_view_id": kanban_info["view_id"],
-                "project_id": project_id
-            })
-    # CRITICAL: Commit the bucket assignment (bucket_id required!)
-    _request("POST", f"/tasks/{task_id}/position", instance=instance, json={
-        "project_view_id": kanban_info["view_id"],
-        "task_id": task_id,
-        "bucket_id": filed_bucket
-    })
+    _move_task_to_bucket(task_id, project_id, kanban_info["view_id"], filed_bucket,
+                         instance=instance)
 
     return {
         "filed": task_id,
@@ -1323,7 +1955,7 @@ def set_reminders(
 
 @mcp.tool()
 def add_to_calendar(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     title: str = Field(description="Event title"),
     due_date: str = Field(description="Due date/time in ISO format"),
     description: str = Field(default="", description="Optional description"),
@@ -1346,18 +1978,17 @@ def add_to_calendar(
 
     task = _request("PUT", f"/projects/{project_id}/tasks", json=data)
     task_id = task["id"]
+    _invalidate_tasks_cache()
 
     # Find or create the label
-    labels = _request("GET", "/labels")
-    label_id = None
-    for label in labels:
-        if label.get("title", "").lower() == label_name.lower():
-            label_id = label["id"]
-            break
+    label_key = label_name.lower()
+    label_map = _get_labels_map()
+    label_id = label_map.get(label_key)
 
     if not label_id:
         new_label = _request("PUT", "/labels", json={"title": label_name, "hex_color": "3498db"})
         label_id = new_label["id"]
+        label_map[label_key] = label_id
 
     # Add label to task
     _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
@@ -1376,17 +2007,19 @@ def add_to_calendar(
 
 @mcp.tool()
 def delete_view(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     view_id: int = Field(description="View ID to delete")
 ) -> dict:
     """Delete a view from a project."""
     _request("DELETE", f"/projects/{project_id}/views/{view_id}")
+    _invalidate_kanban_view_cache()
+    _KANBAN_CACHE.clear()
     return {"success": True, "deleted_view": view_id, "project_id": project_id}
 
 
 @mcp.tool()
 def update_view(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     view_id: int = Field(description="View ID to update"),
     title: str = Field(default="", description="New title (empty = keep current)"),
     filter_query: str = Field(default="", description="New filter (empty = keep current)")
@@ -1405,18 +2038,19 @@ def update_view(
 
 @mcp.tool()
 def delete_bucket(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     view_id: int = Field(description="View ID"),
     bucket_id: int = Field(description="Bucket ID to delete")
 ) -> dict:
     """Delete a kanban bucket. Tasks may be moved to another bucket."""
     _request("DELETE", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}")
+    _KANBAN_CACHE.clear()
     return {"deleted": True, "bucket_id": bucket_id}
 
 
 @mcp.tool()
 def get_view_tasks(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     view_id: int = Field(description="View ID")
 ) -> dict:
     """Get tasks via a specific view. For kanban, includes bucket info."""
@@ -1424,13 +2058,12 @@ def get_view_tasks(
     tasks = []
     for item in response:
         if "tasks" in item:
-            # Kanban bucket with nested tasks
+            # Kanban bucket with nested tasks; extend from a generator so
+            # only the projected dicts are ever materialized.
             bucket_id = item["id"]
             bucket_title = item.get("title", "")
-            for task in (item.get("tasks") or []):
-                task["bucket_id"] = bucket_id
-                task["bucket_title"] = bucket_title
-                tasks.append({
+            tasks.extend(
+                {
                     "id": task["id"],
                     "title": task.get("title", ""),
                     "done": task.get("done", False),
@@ -1438,7 +2071,9 @@ def get_view_tasks(
                     "due_date": task.get("due_date"),
                     "bucket_id": bucket_id,
                     "bucket_title": bucket_title
-                })
+                }
+                for task in item.get("tasks") or ()
+            )
         else:
             # Non-kanban view - flat task list
             tasks.append({
@@ -1453,8 +2088,8 @@ def get_view_tasks(
 
 @mcp.tool()
 def list_tasks_by_bucket(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID")
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField
 ) -> dict:
     """Get tasks grouped by kanban bucket. Returns dict with bucket names as keys."""
     response = _request("GET", f"/projects/{project_id}/views/{view_id}/tasks")
@@ -1470,14 +2105,14 @@ def list_tasks_by_bucket(
                     "done": t.get("done", False),
                     "priority": t.get("priority", 0),
                     "due_date": t.get("due_date")
-                } for t in (item.get("tasks") or [])]
+                } for t in (item.get("tasks") or ())]
             }
     return buckets
 
 
 @mcp.tool()
 def set_view_position(
-    task_id: int = Field(description="Task ID"),
+    task_id: int = TaskIDField,
     view_id: int = Field(description="View ID"),
     position: float = Field(description="Position value (lower = earlier)")
 ) -> dict:
@@ -1491,7 +2126,7 @@ def set_view_position(
 
 @mcp.tool()
 def create_filtered_view(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     title: str = Field(description="View title"),
     view_kind: str = Field(description="View type: list, kanban, gantt, or table"),
     filter_query: str = Field(description="Filter query (e.g., 'priority >= 3', 'dueDate < now')"),
@@ -1506,6 +2141,7 @@ def create_filtered_view(
         "bucket_configuration_mode": 1 if bucket_config_mode == "manual" else 0
     }
     view = _request("PUT", f"/projects/{project_id}/views", json=data)
+    _invalidate_kanban_view_cache()
     return {"id": view["id"], "title": view.get("title", ""), "view_kind": view.get("view_kind", ""), "filter": filter_query}
 
 
@@ -1515,7 +2151,7 @@ def create_filtered_view(
 
 @mcp.tool()
 def batch_create_tasks(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     tasks: list = Field(description="List of task objects: [{title, description?, due_date?, priority?, labels?, bucket?, ref?, blocked_by?, blocks?}]"),
     create_missing_labels: bool = Field(default=True, description="Auto-create labels that don't exist")
 ) -> dict:
@@ -1526,103 +2162,111 @@ def batch_create_tasks(
     result = {"created": 0, "tasks": [], "labels_created": [], "relations_created": 0, "errors": []}
     ref_to_id = {}
 
-    # Get existing labels
-    existing_labels = {l["title"].lower(): l["id"] for l in _request("GET", "/labels")}
+    # Get existing labels (auto-creates below insert into the cached map)
+    existing_labels = _get_labels_map()
 
-    # Get kanban view and buckets if any task specifies a bucket
+    # Get kanban view and buckets if any task specifies a bucket (cached
+    # layout, so a batch right after setup_kanban_board pays no extra GETs)
     bucket_map = {}
     if any(t.get("bucket") for t in tasks):
-        views = _request("GET", f"/projects/{project_id}/views")
-        for v in views:
-            if v.get("view_kind") == "kanban":
-                buckets = _request("GET", f"/projects/{project_id}/views/{v['id']}/buckets")
-                bucket_map = {b["title"]: {"id": b["id"], "view_id": v["id"]} for b in buckets}
-                break
+        layout = _get_kanban_layout(project_id)
+        if "error" not in layout:
+            view_id = layout["view_id"]
+            bucket_map = {
+                title: {"id": bucket_id, "view_id": view_id}
+                for title, bucket_id in layout["buckets"].items()
+            }
 
-    # Create tasks
-    for task_input in tasks:
+    # Phase 1: pre-create the union of missing labels concurrently, so the
+    # per-task phase never has to serialize on label creation (and the same
+    # label isn't created twice by two tasks in the batch).
+    if create_missing_labels:
+        wanted = {name.lower(): name for t in tasks for name in t.get("labels", [])}
+        label_futures = [
+            (name, _PROJECT_FANOUT.submit(
+                _request, "PUT", "/labels", json={"title": name, "hex_color": "808080"}))
+            for key, name in wanted.items() if key not in existing_labels
+        ]
+        for name, future in label_futures:
+            try:
+                existing_labels[name.lower()] = future.result()["id"]
+                result["labels_created"].append(name)
+            except Exception as e:
+                result["errors"].append(f"Failed to create label '{name}': {e}")
+
+    def _create_one(task_input: dict) -> int:
+        data = {"title": task_input["title"], "project_id": project_id}
+        for field in ("description", "due_date", "start_date", "end_date", "priority"):
+            if task_input.get(field):
+                data[field] = task_input[field]
+        return _request("PUT", f"/projects/{project_id}/tasks", json=data)["id"]
+
+    def _decorate_one(task_input: dict, task_id: int) -> None:
+        for label_name in task_input.get("labels", []):
+            label_id = existing_labels.get(label_name.lower())
+            if label_id is not None:
+                _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
+
+        bucket_name = task_input.get("bucket")
+        if bucket_name and bucket_name in bucket_map:
+            bucket_info = bucket_map[bucket_name]
+            _move_task_to_bucket(task_id, project_id, bucket_info["view_id"], bucket_info["id"])
+
+    # Phase 2: the creates are independent of each other - fan them out.
+    create_futures = [
+        (t, _PROJECT_FANOUT.submit(_create_one, t)) for t in tasks
+    ]
+    created = []
+    for task_input, future in create_futures:
         try:
-            data = {"title": task_input["title"], "project_id": project_id}
-            if task_input.get("description"):
-                data["description"] = task_input["description"]
-            if task_input.get("due_date"):
-                data["due_date"] = task_input["due_date"]
-            if task_input.get("start_date"):
-                data["start_date"] = task_input["start_date"]
-            if task_input.get("end_date"):
-                data["end_date"] = task_input["end_date"]
-            if task_input.get("priority"):
-                data["priority"] = task_input["priority"]
-
-            task = _request("PUT", f"/projects/{project_id}/tasks", json=data)
-            task_id = task["id"]
-            ref = task_input.get("ref", "")
-            if ref:
-                ref_to_id[ref] = task_id
-
-            # Add labels
-            for label_name in task_input.get("labels", []):
-                label_key = label_name.lower()
-                if label_key not in existing_labels:
-                    if create_missing_labels:
-                        new_label = _request("PUT", "/labels", json={"title": label_name, "hex_color": "808080"})
-                        existing_labels[label_key] = new_label["id"]
-                        result["labels_created"].append(label_name)
-                    else:
-                        continue
-                _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": existing_labels[label_key]})
-
-            # Move to bucket (requires two API calls)
-            bucket_name = task_input.get("bucket")
-            if bucket_name and bucket_name in bucket_map:
-                bucket_info = bucket_map[bucket_name]
-                # Call 1: Add task to bucket
-                bucket_data = {
-                    "task_id": task_id,
-                    "bucket_id": bucket_info["id"],
-                    "project_view_id": bucket_info["view_id"],
-                    "project_id": project_id
-                }
-                _request("POST", f"/projects/{project_id}/views/{bucket_info['view_id']}/buckets/{bucket_info['id']}/tasks",
-                        json=bucket_data)
-                # Call 2: CRITICAL - Commit the bucket assignment (bucket_id required!)
-                position_data = {
-                    "project_view_id": bucket_info["view_id"],
-                    "task_id": task_id,
-                    "bucket_id": bucket_info["id"]
-                }
-                _request("POST", f"/tasks/{task_id}/position", json=position_data)
-
-            result["created"] += 1
-            result["tasks"].append({"ref": ref, "id": task_id, "title": task_input["title"]})
+            task_id = future.result()
         except Exception as e:
             result["errors"].append(f"Failed to create '{task_input.get('title', '?')}': {e}")
+            continue
+        ref = task_input.get("ref", "")
+        if ref:
+            ref_to_id[ref] = task_id
+        created.append((task_input, task_id))
+        result["created"] += 1
+        result["tasks"].append({"ref": ref, "id": task_id, "title": task_input["title"]})
+
+    # Phase 3: labels and bucket moves stay ordered within a task but run
+    # concurrently across tasks.
+    decorate_futures = [
+        (t, task_id, _PROJECT_FANOUT.submit(_decorate_one, t, task_id))
+        for t, task_id in created
+    ]
+    for task_input, task_id, future in decorate_futures:
+        try:
+            future.result()
+        except Exception as e:
+            result["errors"].append(
+                f"Created '{task_input.get('title', '?')}' but failed to decorate it: {e}")
 
-    # Create relations
+    # Phase 4: relations need every ref resolved, so they go last; failures
+    # are ignored as before (refs may point at tasks that failed to create).
+    relation_futures = []
     for task_input in tasks:
-        ref = task_input.get("ref", "")
-        task_id = ref_to_id.get(ref)
+        task_id = ref_to_id.get(task_input.get("ref", ""))
         if not task_id:
             continue
-
-        for blocked_by_ref in task_input.get("blocked_by", []):
-            other_id = ref_to_id.get(blocked_by_ref)
-            if other_id:
-                try:
-                    _request("PUT", f"/tasks/{task_id}/relations", json={"other_task_id": other_id, "relation_kind": "blocked"})
-                    result["relations_created"] += 1
-                except:
-                    pass
-
-        for blocks_ref in task_input.get("blocks", []):
-            other_id = ref_to_id.get(blocks_ref)
+        for other_ref, kind in (
+            [(r, "blocked") for r in task_input.get("blocked_by", [])]
+            + [(r, "blocking") for r in task_input.get("blocks", [])]
+        ):
+            other_id = ref_to_id.get(other_ref)
             if other_id:
-                try:
-                    _request("PUT", f"/tasks/{task_id}/relations", json={"other_task_id": other_id, "relation_kind": "blocking"})
-                    result["relations_created"] += 1
-                except:
-                    pass
+                relation_futures.append(_PROJECT_FANOUT.submit(
+                    _request, "PUT", f"/tasks/{task_id}/relations",
+                    json={"other_task_id": other_id, "relation_kind": kind}))
+    for future in relation_futures:
+        try:
+            future.result()
+            result["relations_created"] += 1
+        except Exception:
+            pass
 
+    _invalidate_tasks_cache()
     return result
 
 
@@ -1640,29 +2284,31 @@ def batch_update_tasks(
             continue
 
         try:
-            current = _request("GET", f"/tasks/{task_id}")
-
-            if "title" in update:
-                current["title"] = update["title"]
-            if "description" in update:
-                current["description"] = update["description"]
-            if "due_date" in update:
-                current["due_date"] = update["due_date"]
-            if "start_date" in update:
-                current["start_date"] = update["start_date"]
-            if "end_date" in update:
-                current["end_date"] = update["end_date"]
-            if "priority" in update:
-                current["priority"] = update["priority"]
+            # Partial update: the endpoint only touches the fields sent
+            # (update_task relies on the same), so the old GET-modify-POST
+            # round trip was pure overhead.
+            data = {
+                k: update[k]
+                for k in ("title", "description", "due_date", "start_date",
+                          "end_date", "priority")
+                if k in update
+            }
             if "reminders" in update:
-                current["reminders"] = [{"reminder": r, "relative_period": 0, "relative_to": ""} for r in update["reminders"]]
+                data["reminders"] = [{"reminder": r, "relative_period": 0, "relative_to": ""} for r in update["reminders"]]
+
+            if not data:
+                # Nothing updatable in the entry - don't pay a write (and
+                # its server-side webhooks) for an empty diff.
+                result["tasks"].append({"id": task_id, "unchanged": True})
+                continue
 
-            response = _request("POST", f"/tasks/{task_id}", json=current)
+            response = _request("POST", f"/tasks/{task_id}", json=data)
             result["updated"] += 1
             result["tasks"].append({"id": task_id, "title": response.get("title", "")})
         except Exception as e:
             result["errors"].append(f"Failed to update task {task_id}: {e}")
 
+    _invalidate_tasks_cache()
     return result
 
 
@@ -1698,7 +2344,8 @@ def bulk_create_labels(
     """Create multiple labels. Skips labels that already exist."""
     result = {"created_count": 0, "labels": [], "skipped": [], "errors": []}
 
-    existing = {l["title"].lower() for l in _request("GET", "/labels")}
+    label_map = _get_labels_map()
+    existing = set(label_map)
 
     for label_spec in labels:
         title = label_spec.get("title", "")
@@ -1718,6 +2365,7 @@ def bulk_create_labels(
             result["created_count"] += 1
             result["labels"].append({"id": label["id"], "title": label.get("title", "")})
             existing.add(title.lower())
+            label_map[title.lower()] = label["id"]
         except Exception as e:
             result["errors"].append(f"Failed to create label '{title}': {e}")
 
@@ -1726,7 +2374,7 @@ def bulk_create_labels(
 
 @mcp.tool()
 def bulk_relabel_tasks(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     task_ids: list = Field(description="List of task IDs"),
     add_labels: list = Field(default=None, description="Labels to add"),
     remove_labels: list = Field(default=None, description="Labels to remove"),
@@ -1735,36 +2383,37 @@ def bulk_relabel_tasks(
     """Bulk update labels on multiple tasks."""
     result = {"updated": 0, "errors": []}
 
-    # Get label ID mapping
-    all_labels = {l["title"].lower(): l["id"] for l in _request("GET", "/labels")}
-
-    for task_id in task_ids:
+    # Get label ID mapping (resolve names once, not per task)
+    all_labels = _get_labels_map()
+    add_ids = [all_labels[n.lower()] for n in (add_labels or []) if n.lower() in all_labels]
+    remove_ids = [all_labels[n.lower()] for n in (remove_labels or []) if n.lower() in all_labels]
+    set_ids = ([all_labels[n.lower()] for n in set_labels if n.lower() in all_labels]
+               if set_labels is not None else None)
+
+    def _relabel_one(task_id: int) -> None:
+        if set_ids is not None:
+            # Remove all existing labels, then add the replacement set
+            task = _request("GET", f"/tasks/{task_id}")
+            for existing_label in task.get("labels") or ():
+                _request("DELETE", f"/tasks/{task_id}/labels/{existing_label['id']}")
+            for label_id in set_ids:
+                _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
+        else:
+            for label_id in remove_ids:
+                try:
+                    _request("DELETE", f"/tasks/{task_id}/labels/{label_id}")
+                except Exception:
+                    pass
+            for label_id in add_ids:
+                _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
+
+    # Within one task the calls stay ordered (removes must precede the
+    # replacement adds); across tasks they're independent, so fan out.
+    futures = [(task_id, _PROJECT_FANOUT.submit(_relabel_one, task_id))
+               for task_id in task_ids]
+    for task_id, future in futures:
         try:
-            if set_labels is not None:
-                # Remove all existing labels
-                task = _request("GET", f"/tasks/{task_id}")
-                for existing_label in task.get("labels", []):
-                    _request("DELETE", f"/tasks/{task_id}/labels/{existing_label['id']}")
-                # Add new labels
-                for label_name in set_labels:
-                    label_id = all_labels.get(label_name.lower())
-                    if label_id:
-                        _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
-            else:
-                if remove_labels:
-                    for label_name in remove_labels:
-                        label_id = all_labels.get(label_name.lower())
-                        if label_id:
-                            try:
-                                _request("DELETE", f"/tasks/{task_id}/labels/{label_id}")
-                            except:
-                                pass
-                if add_labels:
-                    for label_name in add_labels:
-                        label_id = all_labels.get(label_name.lower())
-                        if label_id:
-                            _request("PUT", f"/tasks/{task_id}/labels", json={"label_id": label_id})
-
+            future.result()
             result["updated"] += 1
         except Exception as e:
             result["errors"].append(f"Failed to update task {task_id}: {e}")
@@ -1774,25 +2423,27 @@ def bulk_relabel_tasks(
 
 @mcp.tool()
 def bulk_set_task_positions(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID"),
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
     assignments: list = Field(description="List of {task_id, bucket_id, position?}")
 ) -> dict:
     """Bulk assign tasks to kanban buckets."""
     result = {"moved_count": 0, "tasks": [], "errors": []}
 
+    futures = []
     for assignment in assignments:
         task_id = assignment.get("task_id")
         bucket_id = assignment.get("bucket_id")
         if not task_id or not bucket_id:
             result["errors"].append(f"Invalid assignment: {assignment}")
             continue
+        futures.append((task_id, bucket_id, _PROJECT_FANOUT.submit(
+            _move_task_to_bucket, task_id, project_id, view_id, bucket_id)))
 
+    # Each move's pair stays ordered; independent moves run concurrently.
+    for task_id, bucket_id, future in futures:
         try:
-            _request("POST", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}/tasks",
-                    json={"task_id": task_id, "bucket_id": bucket_id, "project_view_id": view_id, "project_id": project_id})
-            # CRITICAL: Commit the bucket assignment (bucket_id required!)
-            _request("POST", f"/tasks/{task_id}/position", json={"project_view_id": view_id, "task_id": task_id, "bucket_id": bucket_id})
+            future.result()
             result["moved_count"] += 1
             result["tasks"].append({"task_id": task_id, "bucket_id": bucket_id, "success": True})
         except Exception as e:
@@ -1806,10 +2457,10 @@ def bulk_set_task_positions(
 # ============================================================================
 
 KANBAN_TEMPLATES = {
-    "gtd": ["📥 Inbox", "⏳ Next", "🔄 Waiting", "📅 Someday", "✅ Done"],
-    "sprint": ["📋 Backlog", "📝 To Do", "🔨 In Progress", "👀 Review", "✅ Done"],
-    "kitchen": ["💡 Idea", "📋 Planning", "🛒 Shopping", "🧹 Prep", "🍳 Cooking", "🍽️ Plating", "🧼 Cleanup", "📸 Photo", "✅ Done"],
-    "simple": ["📝 To Do", "🔨 Doing", "✅ Done"]
+    "gtd": ("📥 Inbox", "⏳ Next", "🔄 Waiting", "📅 Someday", "✅ Done"),
+    "sprint": ("📋 Backlog", "📝 To Do", "🔨 In Progress", "👀 Review", "✅ Done"),
+    "kitchen": ("💡 Idea", "📋 Planning", "🛒 Shopping", "🧹 Prep", "🍳 Cooking", "🍽️ Plating", "🧼 Cleanup", "📸 Photo", "✅ Done"),
+    "simple": ("📝 To Do", "🔨 Doing", "✅ Done")
 }
 
 
@@ -1830,6 +2481,7 @@ def setup_kanban_board(
     # Get or create project
     if project_title and not project_id:
         proj = _request("PUT", "/projects", json={"title": project_title})
+        _invalidate_projects_cache()
         project_id = proj["id"]
         created_project = True
     else:
@@ -1854,6 +2506,7 @@ def setup_kanban_board(
             "view_kind": "kanban",
             "bucket_configuration_mode": "manual"
         })
+        _invalidate_kanban_view_cache()
         view_existed = False
     view_id = view["id"]
 
@@ -1861,28 +2514,44 @@ def setup_kanban_board(
     existing_buckets = _request("GET", f"/projects/{project_id}/views/{view_id}/buckets")
     existing_bucket_map = {b["title"]: b for b in existing_buckets}
 
-    # Create buckets (idempotent - reuse existing by title)
+    # Create buckets (idempotent - reuse existing by title). Positions are
+    # explicit, so the missing ones can be created concurrently; Vikunja has
+    # no /batch endpoint to fold them into a single call.
+    new_bucket_futures = {
+        name: _PROJECT_FANOUT.submit(
+            _request, "PUT", f"/projects/{project_id}/views/{view_id}/buckets",
+            json={"title": name, "position": i * 1000})
+        for i, name in enumerate(bucket_names) if name not in existing_bucket_map
+    }
     created_buckets = []
-    for i, name in enumerate(bucket_names):
-        if name in existing_bucket_map:
-            bucket = existing_bucket_map[name]  # Reuse existing
-        else:
-            bucket = _request("PUT", f"/projects/{project_id}/views/{view_id}/buckets",
-                            json={"title": name, "position": i * 1000})
+    for name in bucket_names:
+        bucket = existing_bucket_map.get(name)
+        if bucket is None:
+            bucket = new_bucket_futures[name].result()
         created_buckets.append({"id": bucket["id"], "title": bucket["title"]})
+    if new_bucket_futures:
+        _KANBAN_CACHE.clear()
 
     # Delete default buckets AFTER template buckets exist
     buckets_deleted = 0
     if delete_default_buckets:
         all_buckets = _request("GET", f"/projects/{project_id}/views/{view_id}/buckets")
         created_bucket_ids = {b["id"] for b in created_buckets}
-        for bucket in all_buckets:
-            if bucket["id"] not in created_bucket_ids:
-                try:
-                    _request("DELETE", f"/projects/{project_id}/views/{view_id}/buckets/{bucket['id']}")
-                    buckets_deleted += 1
-                except:
-                    pass
+        to_delete = [b for b in all_buckets if b["id"] not in created_bucket_ids]
+        delete_futures = [
+            (bucket, _PROJECT_FANOUT.submit(
+                _request, "DELETE",
+                f"/projects/{project_id}/views/{view_id}/buckets/{bucket['id']}"))
+            for bucket in to_delete
+        ]
+        for bucket, future in delete_futures:
+            try:
+                future.result()
+                buckets_deleted += 1
+            except Exception as e:
+                logger.warning(f"Failed to delete default bucket {bucket['id']}: {e}")
+        if delete_futures:
+            _KANBAN_CACHE.clear()
 
     return {
         "project_id": project_id,
@@ -1890,7 +2559,7 @@ def setup_kanban_board(
         "view_id": view_id,
         "view_title": view_title,
         "view_existed": view_existed,
-        "buckets_created": len([b for b in created_buckets if b["title"] not in existing_bucket_map]),
+        "buckets_created": len(new_bucket_futures),
         "buckets": created_buckets,
         "buckets_deleted": buckets_deleted
     }
@@ -1920,33 +2589,52 @@ def setup_project(
             "view_kind": "kanban",
             "project_id": project_id
         })
+        _invalidate_kanban_view_cache()
 
     # Create buckets
     if buckets and kanban_view:
         view_id = kanban_view["id"]
         existing = {b["title"] for b in _request("GET", f"/projects/{project_id}/views/{view_id}/buckets")}
-        for i, name in enumerate(buckets):
-            if name not in existing:
-                try:
-                    _request("PUT", f"/projects/{project_id}/views/{view_id}/buckets",
-                            json={"title": name, "position": i * 1000})
-                    result["buckets_created"].append(name)
-                except Exception as e:
-                    result["errors"].append(f"Failed to create bucket '{name}': {e}")
-
-    # Create labels
-    existing_labels = {l["title"].lower() for l in _request("GET", "/labels")}
+        bucket_futures = [
+            (name, _PROJECT_FANOUT.submit(
+                _request, "PUT", f"/projects/{project_id}/views/{view_id}/buckets",
+                json={"title": name, "position": i * 1000}))
+            for i, name in enumerate(buckets) if name not in existing
+        ]
+        for name, future in bucket_futures:
+            try:
+                future.result()
+                result["buckets_created"].append(name)
+            except Exception as e:
+                result["errors"].append(f"Failed to create bucket '{name}': {e}")
+        if bucket_futures:
+            _KANBAN_CACHE.clear()
+
+    # Create labels: dedup against the cached map (and within the request)
+    # first, then create the missing ones concurrently.
+    label_map = _get_labels_map()
+    new_labels = []
+    seen = set()
     for label_spec in labels:
         name = label_spec.get("name", "")
-        if not name or name.lower() in existing_labels:
+        key = name.lower()
+        if not name or key in label_map or key in seen:
             continue
+        seen.add(key)
+        data = {"title": name}
+        if label_spec.get("color"):
+            data["hex_color"] = label_spec["color"].lstrip("#")
+        new_labels.append((name, data))
+
+    label_futures = [
+        (name, _PROJECT_FANOUT.submit(_request, "PUT", "/labels", json=data))
+        for name, data in new_labels
+    ]
+    for name, future in label_futures:
         try:
-            data = {"title": name}
-            if label_spec.get("color"):
-                data["hex_color"] = label_spec["color"].lstrip("#")
-            _request("PUT", "/labels", json=data)
+            label = future.result()
             result["labels_created"].append(name)
-            existing_labels.add(name.lower())
+            label_map[name.lower()] = label["id"]
         except Exception as e:
             result["errors"].append(f"Failed to create label '{name}': {e}")
 
@@ -1961,8 +2649,8 @@ def setup_project(
 
 @mcp.tool()
 def sort_bucket(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID"),
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
     bucket_id: int = Field(description="Bucket ID to sort"),
     sort_by: str = Field(default="due_date", description="Sort field: due_date, priority, title, created"),
     then_by: str = Field(default="", description="Secondary sort for ties")
@@ -1979,23 +2667,27 @@ def sort_bucket(
     if not bucket_tasks:
         return {"sorted": 0, "error": "No tasks in bucket"}
 
-    # Sort tasks
-    def get_sort_key(task):
-        primary = task.get(sort_by) or ""
-        secondary = task.get(then_by) or "" if then_by else ""
-        return (primary, secondary)
-
-    sorted_tasks = sorted(bucket_tasks, key=get_sort_key)
+    # Sort tasks: decorate once, sort tuples, undecorate. The index keeps
+    # the sort stable and stops ties from ever comparing the task dicts.
+    decorated = [
+        (task.get(sort_by) or "", (task.get(then_by) or "") if then_by else "", i, task)
+        for i, task in enumerate(bucket_tasks)
+    ]
+    decorated.sort(key=operator.itemgetter(0, 1, 2))
+    sorted_tasks = [d[3] for d in decorated]
 
-    # Update positions
+    # Update positions; each target position is fixed up front, so the
+    # writes are independent and can run concurrently.
     result = {"sorted": 0, "tasks": [], "errors": []}
-    for i, task in enumerate(sorted_tasks):
-        position = (i + 1) * 1000
+    futures = [
+        (task, position, _PROJECT_FANOUT.submit(
+            _request, "POST", f"/tasks/{task['id']}/position",
+            json={"position": position, "view_id": view_id}))
+        for position, task in (((i + 1) * 1000, task) for i, task in enumerate(sorted_tasks))
+    ]
+    for task, position, future in futures:
         try:
-            _request("POST", f"/tasks/{task['id']}/position", json={
-                "position": position,
-                "view_id": view_id
-            })
+            future.result()
             result["sorted"] += 1
             result["tasks"].append({"task_id": task["id"], "position": position})
         except Exception as e:
@@ -2014,16 +2706,14 @@ def move_task_to_project(
     target_project_id: int = Field(description="Target project ID")
 ) -> dict:
     """Move a task to a different project."""
-    task = _request("GET", f"/tasks/{task_id}")
-    old_project_id = task.get("project_id")
-
-    task["project_id"] = target_project_id
-    _request("POST", f"/tasks/{task_id}", json=task)
+    # Vikunja accepts partial updates, so one POST with just the new
+    # project_id does the move - no GET round trip for the full task.
+    updated = _request("POST", f"/tasks/{task_id}", json={"project_id": target_project_id})
+    _invalidate_tasks_cache()
 
     return {
         "task_id": task_id,
-        "title": task.get("title", ""),
-        "old_project_id": old_project_id,
+        "title": updated.get("title", ""),
         "new_project_id": target_project_id,
         "moved": True
     }
@@ -2035,17 +2725,16 @@ def move_task_to_project_by_name(
     project_name: str = Field(description="Target project name (fuzzy match)")
 ) -> dict:
     """Move a task to a project by name (fuzzy matching)."""
-    # Find matching projects
-    projects = _request("GET", "/projects")
+    # Find matching projects; an exact title match wins immediately
+    projects = _get_projects()
     matches = []
     project_name_lower = project_name.lower()
 
     for p in projects:
-        title = p.get("title", "")
-        if title.lower() == project_name_lower:
-            matches = [p]
-            break
-        elif project_name_lower in title.lower():
+        title_lower = p.get("title", "").lower()
+        if title_lower == project_name_lower:
+            return move_task_to_project(task_id=task_id, target_project_id=p["id"])
+        elif project_name_lower in title_lower:
             matches.append(p)
 
     if not matches:
@@ -2053,94 +2742,119 @@ def move_task_to_project_by_name(
     elif len(matches) > 1:
         return {"error": "Ambiguous project name", "matches": [p.get("title") for p in matches]}
 
-    target = matches[0]
-    return move_task_to_project(task_id=task_id, target_project_id=target["id"])
+    return move_task_to_project(task_id=task_id, target_project_id=matches[0]["id"])
 
 
 @mcp.tool()
 def complete_tasks_by_label(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     label_filter: str = Field(description="Label name to match")
 ) -> dict:
     """Complete all tasks with a matching label."""
     tasks = _request("GET", f"/projects/{project_id}/tasks")
     result = {"completed": 0, "tasks": [], "errors": []}
 
+    needle = label_filter.lower()
+    targets = []
     for task in tasks:
         if task.get("done"):
             continue
 
-        task_labels = [l.get("title", "").lower() for l in task.get("labels", [])]
-        if label_filter.lower() in " ".join(task_labels):
-            try:
-                _request("POST", f"/tasks/{task['id']}", json={"done": True})
-                result["completed"] += 1
-                result["tasks"].append({"id": task["id"], "title": task.get("title", "")})
-            except Exception as e:
-                result["errors"].append(f"Failed to complete task {task['id']}: {e}")
+        task_labels = {l.get("title", "").lower() for l in task.get("labels", [])}
+        if needle in task_labels:
+            targets.append(task)
 
+    futures = [
+        (task, _PROJECT_FANOUT.submit(
+            _request, "POST", f"/tasks/{task['id']}", json={"done": True}))
+        for task in targets
+    ]
+    for task, future in futures:
+        try:
+            future.result()
+            result["completed"] += 1
+            result["tasks"].append({"id": task["id"], "title": task.get("title", "")})
+        except Exception as e:
+            result["errors"].append(f"Failed to complete task {task['id']}: {e}")
+
+    _invalidate_tasks_cache()
     return result
 
 
 @mcp.tool()
 def move_tasks_by_label(
-    project_id: int = Field(description="Project ID"),
+    project_id: int = ProjectIDField,
     label_filter: str = Field(description="Label name to match"),
-    view_id: int = Field(description="Kanban view ID"),
+    view_id: int = KanbanViewIDField,
     bucket_id: int = Field(description="Target bucket ID")
 ) -> dict:
     """Move all tasks with a matching label to a bucket."""
     tasks = _request("GET", f"/projects/{project_id}/tasks")
     result = {"moved": 0, "tasks": [], "errors": []}
 
+    needle = label_filter.lower()
+    targets = []
     for task in tasks:
         if task.get("done"):
             continue
 
-        task_labels = [l.get("title", "").lower() for l in task.get("labels", [])]
-        if label_filter.lower() in " ".join(task_labels):
-            try:
-                _request("POST", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}/tasks",
-                        json={"task_id": task["id"], "bucket_id": bucket_id, "project_view_id": view_id, "project_id": project_id})
-                # CRITICAL: Commit the bucket assignment (bucket_id required!)
-                _request("POST", f"/tasks/{task['id']}/position", json={"project_view_id": view_id, "task_id": task["id"], "bucket_id": bucket_id})
-                result["moved"] += 1
-                result["tasks"].append({"id": task["id"], "title": task.get("title", "")})
-            except Exception as e:
-                result["errors"].append(f"Failed to move task {task['id']}: {e}")
+        task_labels = {l.get("title", "").lower() for l in task.get("labels", [])}
+        if needle in task_labels:
+            targets.append(task)
+
+    futures = [
+        (task, _PROJECT_FANOUT.submit(
+            _move_task_to_bucket, task["id"], project_id, view_id, bucket_id))
+        for task in targets
+    ]
+    for task, future in futures:
+        try:
+            future.result()
+            result["moved"] += 1
+            result["tasks"].append({"id": task["id"], "title": task.get("title", "")})
+        except Exception as e:
+            result["errors"].append(f"Failed to move task {task['id']}: {e}")
 
     return result
 
 
 @mcp.tool()
 def move_tasks_by_label_to_buckets(
-    project_id: int = Field(description="Project ID"),
-    view_id: int = Field(description="Kanban view ID"),
+    project_id: int = ProjectIDField,
+    view_id: int = KanbanViewIDField,
     label_to_bucket_map: dict = Field(description="Map of label titles to bucket IDs")
 ) -> dict:
     """Move tasks to buckets based on their labels."""
     tasks = _request("GET", f"/projects/{project_id}/tasks")
     result = {"moved_count": 0, "by_label": {}, "errors": []}
 
+    # One pass over the tasks builds a label -> tasks index, so each map
+    # entry is a dict lookup instead of a full rescan of the project.
+    tasks_by_label = defaultdict(list)
+    for task in tasks:
+        if task.get("done"):
+            continue
+        for label in task.get("labels") or ():
+            tasks_by_label[label.get("title", "").lower()].append(task)
+
+    moves = []
     for label_title, bucket_id in label_to_bucket_map.items():
         result["by_label"][label_title] = 0
-        label_lower = label_title.lower()
-
-        for task in tasks:
-            if task.get("done"):
-                continue
+        for task in tasks_by_label.get(label_title.lower(), ()):
+            moves.append((label_title, bucket_id, task))
 
-            task_labels = [l.get("title", "").lower() for l in task.get("labels", [])]
-            if label_lower in task_labels:
-                try:
-                    _request("POST", f"/projects/{project_id}/views/{view_id}/buckets/{bucket_id}/tasks",
-                            json={"task_id": task["id"], "bucket_id": bucket_id, "project_view_id": view_id, "project_id": project_id})
-                    # CRITICAL: Commit the bucket assignment (bucket_id required!)
-                    _request("POST", f"/tasks/{task['id']}/position", json={"project_view_id": view_id, "task_id": task["id"], "bucket_id": bucket_id})
-                    result["moved_count"] += 1
-                    result["by_label"][label_title] += 1
-                except Exception as e:
-                    result["errors"].append(f"Failed to move task {task['id']}: {e}")
+    futures = [
+        (label_title, task, _PROJECT_FANOUT.submit(
+            _move_task_to_bucket, task["id"], project_id, view_id, bucket_id))
+        for label_title, bucket_id, task in moves
+    ]
+    for label_title, task, future in futures:
+        try:
+            future.result()
+            result["moved_count"] += 1
+            result["by_label"][label_title] += 1
+        except Exception as e:
+            result["errors"].append(f"Failed to move task {task['id']}: {e}")
 
     return result
 
@@ -2152,7 +2866,7 @@ def move_tasks_by_label_to_buckets(
 @mcp.tool()
 def export_all_projects() -> dict:
     """Export all projects and tasks for backup."""
-    projects = _request("GET", "/projects")
+    projects = _get_projects()
     result = {
         "exported_at": datetime.now(timezone.utc).isoformat(),
         "project_count": len(projects),
@@ -2160,26 +2874,29 @@ def export_all_projects() -> dict:
         "projects": []
     }
 
-    for project in projects:
+    task_futures = [
+        _PROJECT_FANOUT.submit(_request, "GET", f"/projects/{project['id']}/tasks")
+        for project in projects
+    ]
+    for project, future in zip(projects, task_futures):
         project_data = {
             "id": project["id"],
             "title": project.get("title", ""),
             "description": project.get("description", ""),
-            "tasks": []
+            "tasks": [
+                {
+                    "id": task["id"],
+                    "title": task.get("title", ""),
+                    "description": task.get("description", ""),
+                    "done": task.get("done", False),
+                    "priority": task.get("priority", 0),
+                    "due_date": task.get("due_date"),
+                    "labels": [l.get("title") for l in task.get("labels", [])]
+                }
+                for task in future.result()
+            ]
         }
 
-        tasks = _request("GET", f"/projects/{project['id']}/tasks")
-        for task in tasks:
-            project_data["tasks"].append({
-                "id": task["id"],
-                "title": task.get("title", ""),
-                "description": task.get("description", ""),
-                "done": task.get("done", False),
-                "priority": task.get("priority", 0),
-                "due_date": task.get("due_date"),
-                "labels": [l.get("title") for l in task.get("labels", [])]
-            })
-
         result["task_count"] += len(project_data["tasks"])
         result["projects"].append(project_data)
 
@@ -2193,43 +2910,64 @@ def import_from_export(
 ) -> dict:
     """Import projects from an export file."""
     try:
-        export_data = json.loads(export_json)
-    except json.JSONDecodeError as e:
+        export_data = _loads(export_json)
+    except ValueError as e:
         return {"error": f"Invalid JSON: {e}"}
 
     result = {"projects_created": 0, "tasks_created": 0, "skipped": [], "errors": []}
 
     # Get existing project titles
-    existing = {p.get("title", "").lower() for p in _request("GET", "/projects")}
+    existing = {p.get("title", "").lower() for p in _get_projects()}
 
+    to_create = []
     for project_data in export_data.get("projects", []):
         title = project_data.get("title", "")
 
         if skip_existing and title.lower() in existing:
             result["skipped"].append(title)
             continue
-
+        to_create.append(project_data)
+
+    # Phase 1: create the projects concurrently (they are independent)
+    project_futures = [
+        (project_data, _FANOUT.submit(_request, "PUT", "/projects", json={
+            "title": project_data.get("title", ""),
+            "description": project_data.get("description", "")
+        }))
+        for project_data in to_create
+    ]
+    created = []
+    for project_data, future in project_futures:
         try:
-            # Create project
-            project = _request("PUT", "/projects", json={
-                "title": title,
-                "description": project_data.get("description", "")
-            })
+            project = future.result()
             result["projects_created"] += 1
-
-            # Create tasks
-            for task_data in project_data.get("tasks", []):
-                _request("PUT", f"/projects/{project['id']}/tasks", json={
-                    "title": task_data.get("title", ""),
-                    "description": task_data.get("description", ""),
-                    "done": task_data.get("done", False),
-                    "priority": task_data.get("priority", 0),
-                    "due_date": task_data.get("due_date")
-                })
-                result["tasks_created"] += 1
+            created.append((project_data, project))
         except Exception as e:
-            result["errors"].append(f"Failed to import project '{title}': {e}")
+            result["errors"].append(
+                f"Failed to import project '{project_data.get('title', '')}': {e}")
+
+    # Phase 2: create tasks concurrently across every created project
+    task_futures = [
+        (project_data.get("title", ""), _PROJECT_FANOUT.submit(
+            _request, "PUT", f"/projects/{project['id']}/tasks", json={
+                "title": task_data.get("title", ""),
+                "description": task_data.get("description", ""),
+                "done": task_data.get("done", False),
+                "priority": task_data.get("priority", 0),
+                "due_date": task_data.get("due_date")
+            }))
+        for project_data, project in created
+        for task_data in project_data.get("tasks", [])
+    ]
+    for title, future in task_futures:
+        try:
+            future.result()
+            result["tasks_created"] += 1
+        except Exception as e:
+            result["errors"].append(f"Failed to import task into '{title}': {e}")
 
+    _invalidate_tasks_cache()
+    _invalidate_projects_cache()
     return result
 
 
@@ -2244,32 +2982,21 @@ def analyze_project_dimensions(
     """Analyze a project's data to discover meaningful grouping dimensions."""
     tasks = _request("GET", f"/projects/{project_id}/tasks")
 
-    # Analyze labels
-    label_counts = {}
-    for task in tasks:
-        for label in task.get("labels", []):
-            title = label.get("title", "")
-            label_counts[title] = label_counts.get(title, 0) + 1
-
-    # Analyze priorities
-    priority_counts = {}
+    # Analyze labels, priorities, and assignees in one pass
+    label_counts = Counter()
+    priority_counts = Counter()
+    assignee_counts = Counter()
     for task in tasks:
-        p = task.get("priority", 0)
-        priority_counts[p] = priority_counts.get(p, 0) + 1
-
-    # Analyze assignees
-    assignee_counts = {}
-    for task in tasks:
-        for assignee in task.get("assignees", []):
-            username = assignee.get("username", "")
-            assignee_counts[username] = assignee_counts.get(username, 0) + 1
+        label_counts.update(l.get("title", "") for l in task.get("labels") or ())
+        priority_counts[task.get("priority", 0)] += 1
+        assignee_counts.update(a.get("username", "") for a in task.get("assignees") or ())
 
     # Suggest kanbans
     suggestions = []
     if len(label_counts) >= 2:
         suggestions.append({
             "name": "By Label",
-            "buckets": list(label_counts.keys())[:8]
+            "buckets": [title for title, _ in label_counts.most_common(8)]
         })
     if any(p >= 3 for p in priority_counts.keys()):
         suggestions.append({
@@ -2280,9 +3007,9 @@ def analyze_project_dimensions(
     return {
         "project_id": project_id,
         "task_count": len(tasks),
-        "labels": [{"title": k, "count": v} for k, v in sorted(label_counts.items(), key=lambda x: -x[1])],
+        "labels": [{"title": k, "count": v} for k, v in label_counts.most_common()],
         "priorities_in_use": sorted(priority_counts.keys(), reverse=True),
-        "assignees": [{"username": k, "count": v} for k, v in sorted(assignee_counts.items(), key=lambda x: -x[1])],
+        "assignees": [{"username": k, "count": v} for k, v in assignee_counts.most_common()],
         "suggested_kanbans": suggestions
     }
 
@@ -2307,11 +3034,8 @@ def check_token_health(
 
     # Test the token
     try:
-        resp = requests.get(
-            f"{url}/api/v1/user",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=10
-        )
+        session, base = _get_session(url, token)
+        resp = session.get(f"{base}/user", timeout=10)
 
         if resp.status_code == 200:
             user = resp.json()
@@ -2348,15 +3072,17 @@ def list_all_projects() -> dict:
     instances = _get_instances()
     result = {"projects": [], "by_instance": {}}
 
-    for name, config in instances.items():
+    def _instance_projects(name):
+        return [
+            {"id": p["id"], "title": p.get("title", ""), "instance": name}
+            for p in _get_projects(name)
+        ]
+
+    futures = {name: _FANOUT.submit(_instance_projects, name) for name in instances}
+    for name, future in futures.items():
         try:
-            projects = _request("GET", "/projects", instance=name)
-            for p in projects:
-                result["projects"].append({
-                    "id": p["id"],
-                    "title": p.get("title", ""),
-                    "instance": name
-                })
+            projects = future.result()
+            result["projects"].extend(projects)
             result["by_instance"][name] = len(projects)
         except Exception as e:
             result["by_instance"][name] = f"Error: {e}"
@@ -2377,20 +3103,42 @@ def list_all_tasks(
 
     result = {"tasks": [], "by_instance": {}}
     now = datetime.now(timezone.utc)
-
-    for name, config in instances.items():
-        try:
-            projects = _request("GET", "/projects", instance=name)
-            instance_tasks = []
-
-            for project in projects:
-                tasks = _request("GET", f"/projects/{project['id']}/tasks", instance=name)
-                for task in tasks:
-                    if not include_done and task.get("done"):
-                        continue
-
-                    due = task.get("due_date")
-                    if filter_due and due:
+    # Precomputed bounds in wire format, so normalized due strings compare
+    # lexicographically without a datetime parse per task.
+    now_str = _utc_str(now)
+    today_prefix = now_str[:10]
+    week_end_str = _utc_str(now + timedelta(days=7))
+
+    def _instance_tasks(name):
+        projects = _get_projects(name)
+        # Per-project fetches go to the inner pool so they overlap; the
+        # outer pool is already occupied by the per-instance closures.
+        task_futures = [
+            _PROJECT_FANOUT.submit(
+                _request, "GET", f"/projects/{project['id']}/tasks", instance=name)
+            for project in projects
+        ]
+        instance_tasks = []
+
+        for project, future in zip(projects, task_futures):
+            tasks = future.result()
+            for task in tasks:
+                if not include_done and task.get("done"):
+                    continue
+
+                due = task.get("due_date")
+                if filter_due and due:
+                    if len(due) == 20 and due[19] == "Z":
+                        # Fast path: already normalized, compare strings
+                        if filter_due == "overdue" and due >= now_str:
+                            continue
+                        elif filter_due == "today":
+                            if not due.startswith(today_prefix) and due >= now_str:
+                                continue
+                        elif filter_due == "week":
+                            if due > week_end_str and due >= now_str:
+                                continue
+                    else:
                         try:
                             due_dt = datetime.fromisoformat(due.replace("Z", "+00:00"))
                             if filter_due == "overdue" and due_dt >= now:
@@ -2404,19 +3152,25 @@ def list_all_tasks(
                                     continue
                         except ValueError:
                             pass
-                    elif filter_due and not due:
-                        continue
-
-                    instance_tasks.append({
-                        "id": task["id"],
-                        "title": task.get("title", ""),
-                        "project": project.get("title", ""),
-                        "project_id": project["id"],
-                        "due_date": due,
-                        "priority": task.get("priority", 0),
-                        "instance": name
-                    })
+                elif filter_due and not due:
+                    continue
 
+                instance_tasks.append({
+                    "id": task["id"],
+                    "title": task.get("title", ""),
+                    "project": project.get("title", ""),
+                    "project_id": project["id"],
+                    "due_date": due,
+                    "priority": task.get("priority", 0),
+                    "instance": name
+                })
+
+        return instance_tasks
+
+    futures = {name: _FANOUT.submit(_instance_tasks, name) for name in instances}
+    for name, future in futures.items():
+        try:
+            instance_tasks = future.result()
             result["tasks"].extend(instance_tasks)
             result["by_instance"][name] = len(instance_tasks)
         except Exception as e:
@@ -2441,33 +3195,44 @@ def search_all(
     result = {"results": [], "by_instance": {}}
     query_lower = query.lower()
 
-    for name, config in instances.items():
-        try:
-            matches = []
+    def _instance_matches(name):
+        matches = []
+
+        # Search projects; fetch every project's tasks concurrently on the
+        # inner pool while the title matching runs.
+        projects = _get_projects(name)
+        task_futures = [
+            _PROJECT_FANOUT.submit(
+                _request, "GET", f"/projects/{p['id']}/tasks", instance=name)
+            for p in projects
+        ]
+        for p, future in zip(projects, task_futures):
+            if query_lower in p.get("title", "").lower():
+                matches.append({
+                    "type": "project",
+                    "id": p["id"],
+                    "title": p.get("title", ""),
+                    "instance": name
+                })
 
-            # Search projects
-            projects = _request("GET", "/projects", instance=name)
-            for p in projects:
-                if query_lower in p.get("title", "").lower():
+            # Search tasks in project
+            tasks = future.result()
+            for t in tasks:
+                if query_lower in t.get("title", "").lower():
                     matches.append({
-                        "type": "project",
-                        "id": p["id"],
-                        "title": p.get("title", ""),
+                        "type": "task",
+                        "id": t["id"],
+                        "title": t.get("title", ""),
+                        "project": p.get("title", ""),
                         "instance": name
                     })
 
-                # Search tasks in project
-                tasks = _request("GET", f"/projects/{p['id']}/tasks", instance=name)
-                for t in tasks:
-                    if query_lower in t.get("title", "").lower():
-                        matches.append({
-                            "type": "task",
-                            "id": t["id"],
-                            "title": t.get("title", ""),
-                            "project": p.get("title", ""),
-                            "instance": name
-                        })
+        return matches
 
+    futures = {name: _FANOUT.submit(_instance_matches, name) for name in instances}
+    for name, future in futures.items():
+        try:
+            matches = future.result()
             result["results"].extend(matches)
             result["by_instance"][name] = len(matches)
         except Exception as e:
@@ -2480,6 +3245,17 @@ def search_all(
 # MAIN
 # ============================================================================
 
+@functools.cache
+def tool_name_set() -> frozenset:
+    """Registered tool names as a frozenset, computed once.
+
+    The registry is fully populated at import time, so the cached value
+    never goes stale. Meant for introspection (tests, diagnostics), not
+    for use while the server is serving - it spins up an event loop.
+    """
+    return frozenset(t.name for t in asyncio.run(mcp.list_tools()))
+
+
 def main():
     """Run the MCP server."""
     mcp.run()
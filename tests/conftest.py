@@ -0,0 +1,90 @@
+"""
+Shared fixtures for vikunja-mcp tests.
+
+Session-scoped fixtures import the server and introspect the tool
+registry once, so individual tests don't repeat that work.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+_SERVER_SRC = Path(__file__).resolve().parent.parent / "src" / "vikunja_mcp" / "server.py"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runintegration", action="store_true", default=False,
+        help="run integration tests against a live Vikunja instance")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live-instance tests unless --runintegration is given."""
+    if config.getoption("--runintegration"):
+        return
+    skip = pytest.mark.skip(reason="needs --runintegration")
+    for item in items:
+        if "vikunja_configured" in item.fixturenames:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """The imported server module, shared across the whole session."""
+    from vikunja_mcp import server
+    return server
+
+
+@pytest.fixture(scope="session")
+def tool_names(pytestconfig):
+    """Frozen set of registered tool names.
+
+    Persisted in pytest's cache against a hash of the server source, so
+    warm runs skip the registry introspection entirely; any edit to
+    server.py invalidates the snapshot.
+    """
+    src_hash = hashlib.sha1(_SERVER_SRC.read_bytes()).hexdigest()
+    cached = pytestconfig.cache.get("vikunja/tool_names", None)
+    if cached is not None and cached.get("hash") == src_hash:
+        return frozenset(cached["names"])
+    from vikunja_mcp import server
+    names = sorted(server.tool_name_set())
+    pytestconfig.cache.set("vikunja/tool_names", {"hash": src_hash, "names": names})
+    return frozenset(names)
+
+
+@pytest.fixture(scope="session")
+def vikunja_configured():
+    """Check if Vikunja credentials are configured."""
+    url = os.environ.get("VIKUNJA_URL")
+    token = os.environ.get("VIKUNJA_TOKEN")
+    if not url or not token:
+        pytest.skip("VIKUNJA_URL and VIKUNJA_TOKEN not set")
+    return url, token
+
+
+@pytest.fixture(scope="session")
+def live_projects(vikunja_configured):
+    """Project list from the live instance, fetched once per session."""
+    from vikunja_mcp.server import _request
+    return _request("GET", "/projects")
+
+
+@pytest.fixture(scope="session")
+def first_project(live_projects):
+    """A project to run targeted integration calls against."""
+    if not live_projects:
+        pytest.skip("No projects to test")
+    return live_projects[0]
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Record integration responses once, replay on later runs."""
+    return {
+        "cassette_library_dir": "tests/cassettes",
+        "record_mode": "once",
+        "filter_headers": ["authorization"],
+    }
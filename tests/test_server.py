@@ -10,145 +10,139 @@ For integration tests (against real Vikunja), set:
     VIKUNJA_TOKEN=your-token
 """
 
-import os
+import re
+from types import MappingProxyType
+
 import pytest
 
-# ============================================================================
-# FIXTURES
-# ============================================================================
+from vikunja_mcp.server import (
+    _format_project,
+    _format_task,
+    _format_task_cached,
+    _request,
+)
+
+# Read-only example payloads shared by the formatter tests
+_EX_TASK_HIGH = MappingProxyType({"id": 123, "title": "Test Task", "done": False, "priority": 3})
+_EX_TASK_DONE = MappingProxyType({"id": 1, "title": "Done Task", "done": True})
+_EX_PROJECT = MappingProxyType({"id": 456, "title": "Test Project"})
 
-@pytest.fixture
-def vikunja_configured():
-    """Check if Vikunja credentials are configured."""
-    url = os.environ.get("VIKUNJA_URL")
-    token = os.environ.get("VIKUNJA_TOKEN")
-    if not url or not token:
-        pytest.skip("VIKUNJA_URL and VIKUNJA_TOKEN not set")
-    return url, token
+
+def _assert_list(x):
+    """Shared list check for raw API responses."""
+    assert type(x) is list, f"expected list, got {type(x).__name__}"
 
 
 # ============================================================================
 # UNIT TESTS (no network required)
 # ============================================================================
 
+# The complete public tool surface, grouped as in the server module.
+# test_tool_count derives from this set, so adding a tool means adding
+# its name here - which is the point: the surface is reviewed, not just
+# counted.
+_EXPECTED_TOOLS = frozenset({
+    # Instances & context
+    "list_instances", "switch_instance", "get_context",
+    "set_active_context", "get_active_context",
+    # Projects
+    "list_projects", "get_project", "create_project",
+    "update_project", "delete_project",
+    # Tasks
+    "list_tasks", "get_task", "create_task", "update_task",
+    "complete_task", "delete_task",
+    # Labels
+    "list_labels", "create_label", "delete_label",
+    "add_label_to_task", "add_labels_to_task",
+    # Views & kanban
+    "list_views", "create_view", "get_kanban_view", "list_buckets",
+    "create_bucket", "set_task_position", "set_task_positions_bulk",
+    "delete_view", "update_view", "delete_bucket", "get_view_tasks",
+    "list_tasks_by_bucket", "set_view_position", "create_filtered_view",
+    # Relations
+    "create_task_relation", "list_task_relations",
+    # Power queries
+    "overdue_tasks", "due_today", "due_this_week",
+    "high_priority_tasks", "urgent_tasks", "focus_now", "task_summary",
+    "unscheduled_tasks", "upcoming_deadlines",
+    # X-Q workflow
+    "check_xq", "setup_xq", "claim_xq_task", "complete_xq_task",
+    # Assignment & reminders
+    "assign_user", "unassign_user", "set_reminders", "add_to_calendar",
+    # Batch & bulk
+    "batch_create_tasks", "batch_update_tasks", "batch_set_positions",
+    "bulk_create_labels", "bulk_relabel_tasks", "bulk_set_task_positions",
+    # Setup & movement
+    "setup_kanban_board", "setup_project", "sort_bucket",
+    "move_task_to_project", "move_task_to_project_by_name",
+    "complete_tasks_by_label", "move_tasks_by_label",
+    "move_tasks_by_label_to_buckets",
+    # Export, analysis, health
+    "export_all_projects", "import_from_export",
+    "analyze_project_dimensions", "check_token_health",
+    # Cross-instance
+    "list_all_projects", "list_all_tasks", "search_all",
+})
+
+
 class TestServerImport:
     """Test that the server module can be imported."""
 
-    def test_import_server(self):
-        """Server module should import without errors."""
-        from vikunja_mcp import server
-        assert server is not None
+    @pytest.mark.parametrize("check", [
+        pytest.param(lambda s: s is not None, id="module"),
+        pytest.param(lambda s: s.mcp is not None, id="mcp"),
+        pytest.param(lambda s: len(s.tool_name_set()) > 0, id="tools"),
+    ])
+    def test_server_surface(self, mcp_server, check):
+        """Module, MCP instance, and tool registry should all be present."""
+        assert check(mcp_server)
 
-    def test_import_mcp(self):
-        """MCP instance should be importable."""
-        from vikunja_mcp.server import mcp
-        assert mcp is not None
 
-    def test_mcp_has_tools(self):
-        """MCP should have tools registered."""
-        from vikunja_mcp.server import mcp
-        tools = mcp._tool_manager._tools
-        assert len(tools) > 0
+# Slack commands, OAuth handlers, user management, billing, and
+# Slack gamification must never leak into the public tool surface.
+_PRIVATE_RE = re.compile(r"slash_|oauth_|_user_|credits|ECO")
 
 
 class TestToolsRegistered:
-    """Test that all expected tools are registered."""
-
-    EXPECTED_TOOLS = [
-        # Projects
-        "list_projects",
-        "get_project",
-        "create_project",
-        "update_project",
-        "delete_project",
-        # Tasks
-        "list_tasks",
-        "get_task",
-        "create_task",
-        "update_task",
-        "complete_task",
-        "delete_task",
-        # Labels
-        "list_labels",
-        "create_label",
-        "delete_label",
-        "add_label_to_task",
-        # Kanban
-        "list_buckets",
-        "create_bucket",
-        # Relations
-        "create_task_relation",
-        "list_task_relations",
-    ]
-
-    def test_all_tools_registered(self):
-        """All expected tools should be registered."""
-        from vikunja_mcp.server import mcp
-
-        tool_names = [t.name for t in mcp._tool_manager._tools.values()]
-
-        for expected in self.EXPECTED_TOOLS:
-            assert expected in tool_names, f"Missing tool: {expected}"
-
-    def test_no_private_tools(self):
-        """No private/internal tools should be exposed."""
-        from vikunja_mcp.server import mcp
-
-        tool_names = [t.name for t in mcp._tool_manager._tools.values()]
-
-        private_patterns = [
-            "slash_",  # Slack commands
-            "oauth_",  # OAuth handlers
-            "_user_",  # User management
-            "credits",  # Billing
-            "ECO",     # Slack gamification
-        ]
-
-        for tool in tool_names:
-            for pattern in private_patterns:
-                assert pattern not in tool, f"Private tool exposed: {tool}"
+    """Test that the registry matches the expected tool surface."""
 
-    def test_tool_count(self):
-        """Should have exactly 19 tools."""
-        from vikunja_mcp.server import mcp
+    # Each check returns the offending names; an empty list is healthy.
+    REGISTRY_CHECKS = [
+        pytest.param(lambda n: sorted(_EXPECTED_TOOLS - n), id="expected_present"),
+        pytest.param(lambda n: sorted(t for t in n if _PRIVATE_RE.search(t)), id="no_private"),
+        pytest.param(lambda n: sorted(n - _EXPECTED_TOOLS), id="no_unexpected"),
+    ]
 
-        tools = mcp._tool_manager._tools
-        assert len(tools) == 19, f"Expected 19 tools, got {len(tools)}"
+    @pytest.mark.parametrize("check", REGISTRY_CHECKS)
+    def test_tool_registry(self, tool_names, check):
+        offenders = check(tool_names)
+        assert not offenders, f"Registry check failed for: {offenders}"
 
 
 class TestHelperFunctions:
     """Test helper functions."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_format_cache(self):
+        """Keep memoized formatter state from leaking between tests."""
+        yield
+        _format_task_cached.cache_clear()
+
     def test_format_task(self):
         """_format_task should format a task dict."""
-        from vikunja_mcp.server import _format_task
-
-        task = {
-            "id": 123,
-            "title": "Test Task",
-            "done": False,
-            "priority": 3,
-        }
-
-        result = _format_task(task)
+        result = _format_task(_EX_TASK_HIGH)
         assert "Test Task" in result
         assert "123" in result
         assert "High" in result  # priority 3 = High
 
     def test_format_task_completed(self):
         """_format_task should show checkmark for done tasks."""
-        from vikunja_mcp.server import _format_task
-
-        task = {"id": 1, "title": "Done Task", "done": True}
-        result = _format_task(task)
+        result = _format_task(_EX_TASK_DONE)
         assert "✓" in result
 
     def test_format_project(self):
         """_format_project should format a project dict."""
-        from vikunja_mcp.server import _format_project
-
-        project = {"id": 456, "title": "Test Project"}
-        result = _format_project(project)
+        result = _format_project(_EX_PROJECT)
         assert "Test Project" in result
         assert "456" in result
 
@@ -157,21 +151,19 @@ class TestHelperFunctions:
 # INTEGRATION TESTS (require real Vikunja instance)
 # ============================================================================
 
+@pytest.mark.vcr
+@pytest.mark.xdist_group("vikunja_ro")
 class TestVikunjaConnection:
     """Integration tests against real Vikunja instance."""
 
     def test_connection(self, vikunja_configured):
         """Should connect to Vikunja API."""
-        from vikunja_mcp.server import _vikunja_request
-
-        projects = _vikunja_request("GET", "/projects")
-        assert isinstance(projects, list)
+        projects = _request("GET", "/projects")
+        _assert_list(projects)
 
     def test_list_projects(self, vikunja_configured):
         """Should list projects."""
-        from vikunja_mcp.server import _vikunja_request
-
-        projects = _vikunja_request("GET", "/projects")
+        projects = _request("GET", "/projects")
         assert len(projects) >= 0
 
         if projects:
@@ -180,32 +172,18 @@ class TestVikunjaConnection:
 
     def test_list_labels(self, vikunja_configured):
         """Should list labels."""
-        from vikunja_mcp.server import _vikunja_request
+        labels = _request("GET", "/labels")
+        _assert_list(labels)
 
-        labels = _vikunja_request("GET", "/labels")
-        assert isinstance(labels, list)
-
-    def test_get_project(self, vikunja_configured):
+    def test_get_project(self, first_project):
         """Should get a specific project."""
-        from vikunja_mcp.server import _vikunja_request
-
-        projects = _vikunja_request("GET", "/projects")
-        if not projects:
-            pytest.skip("No projects to test")
+        project = _request("GET", f"/projects/{first_project['id']}")
+        assert project["id"] == first_project["id"]
 
-        project = _vikunja_request("GET", f"/projects/{projects[0]['id']}")
-        assert project["id"] == projects[0]["id"]
-
-    def test_list_tasks_from_project(self, vikunja_configured):
+    def test_list_tasks_from_project(self, first_project):
         """Should list tasks from a project."""
-        from vikunja_mcp.server import _vikunja_request
-
-        projects = _vikunja_request("GET", "/projects")
-        if not projects:
-            pytest.skip("No projects to test")
-
-        tasks = _vikunja_request("GET", f"/projects/{projects[0]['id']}/tasks")
-        assert isinstance(tasks, list)
+        tasks = _request("GET", f"/projects/{first_project['id']}/tasks")
+        _assert_list(tasks)
 
 
 # ============================================================================
@@ -215,16 +193,11 @@ class TestVikunjaConnection:
 class TestSmokeTest:
     """Quick smoke test to validate before publishing."""
 
-    def test_smoke(self):
+    def test_smoke(self, mcp_server, tool_names):
         """Basic smoke test - import, check tools, no crashes."""
-        from vikunja_mcp.server import mcp, _format_task, _format_project
-
         # Tools registered
-        tools = mcp._tool_manager._tools
-        assert len(tools) == 19
+        assert len(tool_names) == len(_EXPECTED_TOOLS)
 
         # Formatters work
         assert "Test" in _format_task({"id": 1, "title": "Test"})
         assert "Test" in _format_project({"id": 1, "title": "Test"})
-
-        print("✅ Smoke test passed")